@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 # Cache TTL: 1 week (7 days * 24 hours) as per CLAUDE.md spec
 CACHE_TTL_HOURS = 168
 
+# Placeholder left in built queries by the query builder
+LATEST_SET_PLACEHOLDER = "__LATEST_SET__"
+
 
 @dataclass
 class CacheEntry:
@@ -226,7 +229,7 @@ async def resolve_latest_set_placeholder(query: str) -> str:
     - Uses get_latest_expansion_code() with its 1-week cache
     - Only performs an API call if the placeholder is present
     """
-    if "__LATEST_SET__" not in query:
+    if LATEST_SET_PLACEHOLDER not in query:
         return query
 
     try:
@@ -242,7 +245,7 @@ async def resolve_latest_set_placeholder(query: str) -> str:
 
         latest_code = LATEST_SET_CODE_FALLBACK
 
-    return query.replace("__LATEST_SET__", latest_code)
+    return query.replace(LATEST_SET_PLACEHOLDER, latest_code)
 
 
 async def clear_latest_set_cache() -> None:
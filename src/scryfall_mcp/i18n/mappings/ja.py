@@ -416,6 +416,6 @@ japanese_mapping = JapaneseMapping()
 #
 # For reference only (will be removed in future version):
 JAPANESE_CARD_NAMES: dict[str, str] = {
-    # This dictionary is no longer used by the codebase
-    # See: builder.py _convert_card_names() method
+    # This dictionary is no longer used by the codebase; QueryBuilder passes
+    # card names through unchanged (no per-name substitution pass)
 }
@@ -6,12 +6,17 @@ setup guides and documentation.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=8)
 def load_setup_guide(language: str = "ja") -> str:
     """Load setup guide text from resource file.
 
+    The guide is static package data, so each language is read from disk
+    once and the text is reused by every prompt/resource request.
+
     Parameters
     ----------
     language : str, optional (default: "ja")
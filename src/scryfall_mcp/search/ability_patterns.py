@@ -7,13 +7,32 @@ phrases, enabling Phase 2 support for queries like "死亡時にカードを1枚
 from __future__ import annotations
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import attrgetter
+from types import MappingProxyType
 
 from ..i18n.constants import ABILITY_COLOR_TYPE_PATTERN, ABILITY_KNOWN_EFFECTS
 
+# Whitespace runs collapsed after matched phrases are cut out of the text
+_WS_RE = re.compile(r"\s+")
 
-@dataclass
+# Read-only snapshot of the known effects; the scanner below is compiled from
+# the same snapshot so the two can never drift apart.
+_KNOWN_EFFECTS: Mapping[str, str] = MappingProxyType(dict(ABILITY_KNOWN_EFFECTS))
+
+# All known effect phrases fused into one alternation so that an effect is
+# scanned once by the C regex engine instead of once per phrase. Longer
+# phrases come first so that e.g. "破壊する" wins over its prefix "破壊".
+_KNOWN_EFFECTS_RE = re.compile(
+    "|".join(
+        re.escape(phrase) for phrase in sorted(_KNOWN_EFFECTS, key=len, reverse=True)
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
 class AbilityPattern:
     """Represents a regex pattern for matching ability phrases.
 
@@ -24,15 +43,56 @@ class AbilityPattern:
     pattern : re.Pattern
         Compiled regex pattern
     replacement : Callable
-        Function to generate replacement tokens from match
+        Function to generate replacement tokens (a tuple) from match
     priority : int
         Priority for pattern application (higher = first)
+    anchor : str
+        Literal every match starts with; lets the matcher skip scanning text
+        that cannot contain a match
     """
 
     name: str
     pattern: re.Pattern[str]
-    replacement: Callable[[re.Match[str]], list[str]]
+    replacement: Callable[[re.Match[str]], tuple[str, ...]]
     priority: int = 0
+    anchor: str = ""
+
+
+# Trigger phrases: (pattern name, trigger literal, oracle token)
+_TRIGGERS: tuple[tuple[str, str, str], ...] = (
+    # "死亡時に〜する"
+    ("death_trigger_with_effect", "死亡時に", 'o:"when ~ dies"'),
+    # "戦場に出たときに〜する"
+    ("etb_trigger_with_effect", "戦場に出たときに", 'o:"enters the battlefield"'),
+    # "攻撃したときに〜する"
+    ("attack_trigger_with_effect", "攻撃したときに", 'o:"whenever ~ attacks"'),
+)
+
+# Any trigger literal; an effect never runs into the next trigger
+_TRIGGER_LITERALS = "|".join(re.escape(trigger) for _, trigger, _ in _TRIGGERS)
+
+
+def _compile_trigger(trigger: str) -> re.Pattern[str]:
+    """Compile the "<trigger>〜する" pattern shared by all trigger phrases.
+
+    The effect (group 1) stops before a space, a color/type/keyword word,
+    another trigger phrase, or the end of the text; a trailing "する" is not
+    part of the effect. A trigger directly followed by another trigger
+    matches with no effect (group 1 unset). Both keep chained triggers
+    written without spaces (e.g. "戦場に出たときにカードを引く死亡時にライフを得る")
+    from being swallowed by the preceding match in the single fused scan.
+    """
+    return re.compile(
+        rf"{trigger}(?:(?={_TRIGGER_LITERALS})|(.+?)(?:する)?"
+        rf"(?= |{ABILITY_COLOR_TYPE_PATTERN}|{_TRIGGER_LITERALS}|$))"
+    )
+
+
+# Trigger phrases: (pattern name, trigger literal, compiled pattern, oracle token)
+_TRIGGER_SPECS: tuple[tuple[str, str, re.Pattern[str], str], ...] = tuple(
+    (name, trigger, _compile_trigger(trigger), trigger_token)
+    for name, trigger, trigger_token in _TRIGGERS
+)
 
 
 class AbilityPatternMatcher:
@@ -54,19 +114,42 @@ class AbilityPatternMatcher:
     def __init__(self, patterns: list[AbilityPattern]) -> None:
         """Initialize pattern matcher.
 
+        All patterns are fused into one alternation (one named group per
+        pattern, higher priority first so it also wins ties at the same
+        position). Patterns must therefore not use numbered backreferences.
+
         Parameters
         ----------
         patterns : list[AbilityPattern]
             List of ability patterns to apply
         """
         # Sort patterns by priority (higher first)
-        self.patterns = sorted(patterns, key=lambda p: p.priority, reverse=True)
+        self.patterns = sorted(patterns, key=attrgetter("priority"), reverse=True)
+        self._combined: re.Pattern[str] | None = None
+        # Outer group number -> pattern, for dispatch on match.lastindex
+        self._group_specs: dict[int, AbilityPattern] = {}
+        if self.patterns:
+            self._combined = re.compile(
+                "|".join(
+                    f"(?P<p{i}>{spec.pattern.pattern})"
+                    for i, spec in enumerate(self.patterns)
+                )
+            )
+            self._group_specs = {
+                self._combined.groupindex[f"p{i}"]: spec
+                for i, spec in enumerate(self.patterns)
+            }
+        # Literal pre-check is only sound when every pattern has an anchor
+        self._anchors: tuple[str, ...] = ()
+        if all(spec.anchor for spec in self.patterns):
+            self._anchors = tuple(spec.anchor for spec in self.patterns)
 
     def apply(self, text: str) -> tuple[str, list[str]]:
         """Apply patterns to text.
 
-        Processes text through all patterns in priority order, extracting
-        matched ability phrases and converting them to oracle text queries.
+        Scans the text once with all patterns combined, extracting matched
+        ability phrases (in order of appearance) and converting them to
+        oracle text queries.
 
         Parameters
         ----------
@@ -79,32 +162,41 @@ class AbilityPatternMatcher:
             Tuple of (remaining text with matches removed, list of oracle tokens)
         """
         all_tokens: list[str] = []
-        remaining = text
-
-        for pattern_spec in self.patterns:
-            # Find all matches for this pattern
-            matches = list(pattern_spec.pattern.finditer(remaining))
-
-            # Store match positions and tokens to preserve order
-            match_data: list[tuple[int, int, list[str]]] = []
-            for match in matches:
-                new_tokens = pattern_spec.replacement(match)
-                match_data.append((match.start(), match.end(), new_tokens))
-
-            # Process matches in reverse order to avoid index issues when removing
-            for start, end, tokens in reversed(match_data):
+        pieces: list[str] = []
+        last_end = 0
+
+        pos = self._scan_start(text)
+        if self._combined is not None and pos >= 0:
+            for match in self._combined.finditer(text, pos):
+                # The outer group closes last, so lastindex identifies the pattern
+                spec = self._group_specs[match.lastindex or 0]
+                # Re-match standalone so replacements see their own groups
+                spec_match = spec.pattern.match(text, match.start())
+                if spec_match is None:  # pragma: no cover - same regex branch
+                    continue
+                all_tokens.extend(spec.replacement(spec_match))
                 # Remove matched text, replace with space
-                remaining = remaining[:start] + " " + remaining[end:]
-
-            # Add tokens in original order (not reversed)
-            for _, _, tokens in match_data:
-                all_tokens.extend(tokens)
+                pieces.append(text[last_end : match.start()])
+                pieces.append(" ")
+                last_end = match.end()
+        pieces.append(text[last_end:])
 
         # Clean up extra whitespace
-        remaining = " ".join(remaining.split())
+        remaining = _WS_RE.sub(" ", "".join(pieces)).strip()
 
         return remaining, all_tokens
 
+    def _scan_start(self, text: str) -> int:
+        """Return where scanning may start, or -1 when nothing can match.
+
+        Uses the patterns' literal anchors (cheap ``str.find``) to skip the
+        regex scan entirely, or the prefix before the earliest anchor.
+        """
+        if not self._anchors:
+            return 0
+        found = [i for i in map(text.find, self._anchors) if i >= 0]
+        return min(found, default=-1)
+
 
 def create_japanese_patterns(keyword_map: dict[str, str]) -> list[AbilityPattern]:
     """Create Japanese ability patterns for Phase 2.
@@ -119,68 +211,22 @@ def create_japanese_patterns(keyword_map: dict[str, str]) -> list[AbilityPattern
     list[AbilityPattern]
         List of compiled ability patterns
     """
-    patterns: list[AbilityPattern] = []
-
-    # "死亡時に〜する" pattern
-    def death_trigger_replacement(match: re.Match[str]) -> list[str]:
-        tokens = ['o:"when ~ dies"']
-        effect = match.group(1).strip()
-        if effect:
-            # Try to match effect to known phrases
-            effect_tokens = _parse_effect(effect, keyword_map)
-            tokens.extend(effect_tokens)
-        return tokens
-
-    patterns.append(
-        AbilityPattern(
-            name="death_trigger_with_effect",
-            pattern=re.compile(
-                rf"死亡時に(.+?)(?:する)?(?= |{ABILITY_COLOR_TYPE_PATTERN}|$)"
-            ),
-            replacement=death_trigger_replacement,
-            priority=100,
-        )
+    # Identical effect strings recur across queries; memoize their parse per
+    # keyword map (shared by all trigger patterns built here)
+    parse_effect = lru_cache(maxsize=256)(
+        partial(_parse_effect, keyword_map=keyword_map)
     )
 
-    # "戦場に出たときに〜する" pattern
-    def etb_trigger_replacement(match: re.Match[str]) -> list[str]:
-        tokens = ['o:"enters the battlefield"']
-        effect = match.group(1).strip()
-        if effect:
-            effect_tokens = _parse_effect(effect, keyword_map)
-            tokens.extend(effect_tokens)
-        return tokens
-
-    patterns.append(
+    patterns = [
         AbilityPattern(
-            name="etb_trigger_with_effect",
-            pattern=re.compile(
-                rf"戦場に出たときに(.+?)(?:する)?(?= |{ABILITY_COLOR_TYPE_PATTERN}|$)"
-            ),
-            replacement=etb_trigger_replacement,
+            name=name,
+            pattern=pattern,
+            replacement=_make_trigger_replacement(trigger_token, parse_effect),
             priority=100,
+            anchor=trigger,
         )
-    )
-
-    # "攻撃したときに〜する" pattern
-    def attack_trigger_replacement(match: re.Match[str]) -> list[str]:
-        tokens = ['o:"whenever ~ attacks"']
-        effect = match.group(1).strip()
-        if effect:
-            effect_tokens = _parse_effect(effect, keyword_map)
-            tokens.extend(effect_tokens)
-        return tokens
-
-    patterns.append(
-        AbilityPattern(
-            name="attack_trigger_with_effect",
-            pattern=re.compile(
-                rf"攻撃したときに(.+?)(?:する)?(?= |{ABILITY_COLOR_TYPE_PATTERN}|$)"
-            ),
-            replacement=attack_trigger_replacement,
-            priority=100,
-        )
-    )
+        for name, trigger, pattern, trigger_token in _TRIGGER_SPECS
+    ]
 
     # Note: Control-related patterns like "あなたがコントロールする" are handled by
     # Phase 1 dictionary mappings in search_keywords, not Phase 2 pattern matching.
@@ -189,7 +235,69 @@ def create_japanese_patterns(keyword_map: dict[str, str]) -> list[AbilityPattern
     return patterns
 
 
-def _parse_effect(effect_text: str, keyword_map: dict[str, str]) -> list[str]:
+def get_japanese_matcher(keyword_map: Mapping[str, str]) -> AbilityPatternMatcher:
+    """Return a shared Japanese matcher for a keyword map.
+
+    Matchers are stateless once built, so one instance per distinct keyword
+    map is reused across queries instead of rebuilding patterns per request.
+
+    Parameters
+    ----------
+    keyword_map : Mapping[str, str]
+        Mapping from Japanese phrases to oracle text queries
+
+    Returns
+    -------
+    AbilityPatternMatcher
+        Matcher built from `create_japanese_patterns`
+    """
+    return _build_japanese_matcher(frozenset(keyword_map.items()))
+
+
+@lru_cache(maxsize=4)
+def _build_japanese_matcher(
+    keyword_items: frozenset[tuple[str, str]],
+) -> AbilityPatternMatcher:
+    """Build a matcher for a hashable snapshot of a keyword map."""
+    return AbilityPatternMatcher(create_japanese_patterns(dict(keyword_items)))
+
+
+def _make_trigger_replacement(
+    trigger_token: str, parse_effect: Callable[[str], tuple[str, ...]]
+) -> Callable[[re.Match[str]], tuple[str, ...]]:
+    """Create a replacement function for a trigger pattern.
+
+    Parameters
+    ----------
+    trigger_token : str
+        Oracle token emitted for the trigger itself (e.g. 'o:"when ~ dies"')
+    parse_effect : Callable[[str], tuple[str, ...]]
+        Effect parser bound to a keyword map (see `_parse_effect`)
+
+    Returns
+    -------
+    Callable[[re.Match[str]], tuple[str, ...]]
+        Function turning a trigger match into the trigger token followed by
+        any effect tokens parsed from group 1
+    """
+
+    def replacement(match: re.Match[str]) -> tuple[str, ...]:
+        # An unset effect group (trigger followed by a trigger) spans (-1, -1),
+        # which slices to ""
+        start, end = match.span(1)
+        effect = match.string[start:end]
+        # Japanese effects rarely carry surrounding spaces; skip the strip copy
+        if effect and (effect[0].isspace() or effect[-1].isspace()):
+            effect = effect.strip()
+        if not effect:
+            return (trigger_token,)
+        # Try to match effect to known phrases
+        return (trigger_token, *parse_effect(effect))
+
+    return replacement
+
+
+def _parse_effect(effect_text: str, keyword_map: dict[str, str]) -> tuple[str, ...]:
     """Parse effect text into oracle tokens.
 
     Parameters
@@ -201,19 +309,16 @@ def _parse_effect(effect_text: str, keyword_map: dict[str, str]) -> list[str]:
 
     Returns
     -------
-    list[str]
-        List of oracle tokens
+    tuple[str, ...]
+        Unique oracle tokens in order of appearance (immutable so that
+        memoized results can be shared safely)
     """
-    tokens: list[str] = []
-
-    # Try exact match first
+    # Try exact matches first
     if effect_text in keyword_map:
-        tokens.append(keyword_map[effect_text])
-        return tokens
-
-    # Try partial matches for known phrases
-    for phrase, token in ABILITY_KNOWN_EFFECTS.items():
-        if phrase in effect_text:
-            tokens.append(token)
+        return (keyword_map[effect_text],)
+    if effect_text in _KNOWN_EFFECTS:
+        return (_KNOWN_EFFECTS[effect_text],)
 
-    return tokens
+    # Partial matches for known phrases, found in a single scan
+    hits = _KNOWN_EFFECTS_RE.findall(effect_text)
+    return tuple(dict.fromkeys(_KNOWN_EFFECTS[hit] for hit in hits))
@@ -8,15 +8,294 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import product
 from typing import TYPE_CHECKING, Any
 
+from .ability_patterns import AbilityPatternMatcher, get_japanese_matcher
 from .models import BuiltQuery, ParsedQuery
+from .parser import COMPETITIVE_RE
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; every build() reuses them instead of re-resolving
+# pattern strings through the re module cache.
+
+# Japanese conversions
+_COLOR_TYPE_RE = re.compile(
+    r"(?P<color>白|青|黒|赤|緑|無色)い?の?"
+    r"(?P<type>クリーチャー|アーティファクト|エンチャント|インスタント|ソーサリー|土地|プレインズウォーカー)"
+)
+# Power, toughness and mana comparisons in one alternation (one pass instead
+# of three); "点数で見たマナコスト" precedes its suffix "マナコスト"
+_NUMCMP_RE = re.compile(
+    r"(?P<subject>パワー|タフネス|マナ総量|点数で見たマナコスト|マナコスト)が?"
+    r"(?P<number>\d+)(?P<operator>以上|以下|より大きい|未満|と?等しい)?"
+)
+# Both Japanese filter patterns in one scan. Their matches never overlap
+# (different leading words, no shared text), so this equals running
+# _NUMCMP_RE and then _COLOR_TYPE_RE.
+_JA_FILTER_RE = re.compile(f"{_NUMCMP_RE.pattern}|{_COLOR_TYPE_RE.pattern}")
+
+# Phrase values that are query syntax (a "field:" or a comparison); the
+# phrase tables also hold UI labels and messages, which never rewrite queries
+_PHRASE_SYNTAX_RE = re.compile(r"[:<>=]")
+
+# Query cleanup: spaces around ":" and comparison operators are dropped and
+# any other whitespace run collapses to a single space, all in one scan.
+# Each alternative has its own group so matches dispatch on lastindex.
+# Kept on str: ASCII queries are already stored one byte per character, and
+# a bytes pattern would only add an encode/decode round trip.
+_CLEAN_RE = re.compile(r"(\s*:\s*)|\s*([<>=!]+)\s*|(\s+)")
+
+# Query metadata heuristics: fields ("word:"), operator runs and double
+# quotes are disjoint tokens, so one scan yields every count (see
+# _scan_query_stats)
+_STATS_RE = re.compile(r'(\w+):|[<>=!]+|"')
+
+# Japanese common misspellings (see _check_ja_typos)
+_JA_COMMON_MISTAKES = {
+    "くりーちゃー": "クリーチャー",
+    "いんすたんと": "インスタント",
+    "そーさりー": "ソーサリー",
+    "あーてぃふぁくと": "アーティファクト",
+    "えんちゃんと": "エンチャント",
+}
+_JA_MISTAKES_RE = re.compile("|".join(map(re.escape, _JA_COMMON_MISTAKES)))
+
+# Upper bound on memoized query strings shared by all builders
+_QUERY_CACHE_SIZE = 1024
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
     from ..i18n import LanguageMapping
-    from .ability_patterns import AbilityPatternMatcher
+
+
+@dataclass(frozen=True, slots=True)
+class _QueryStats:
+    """Token counts used by the query metadata heuristics."""
+
+    operators: int
+    fields: int
+    specificity: int
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _scan_query_stats(query: str) -> _QueryStats:
+    """Count operators, fields and specific filters in a single scan.
+
+    Specific filters are color (``c:``), type (``t:``), power (``p<op>``),
+    toughness (``tou<op>``) and mana value (``mv<op>``) filters plus
+    non-empty quoted strings. Results are immutable and memoized, since
+    built queries repeat as often as the memoized conversions they come from.
+    """
+    operators = fields = specificity = 0
+    quotes: list[int] = []
+    for match in _STATS_RE.finditer(query):
+        word = match.group(1)
+        if word is not None:
+            fields += 1
+            # "c:" / "t:" always end a field token
+            if word[-1] in "ct":
+                specificity += 1
+        elif match.group() == '"':
+            quotes.append(match.start())
+        else:
+            operators += 1
+            # "p" / "tou" / "mv" directly before the operator run
+            if query.endswith(("p", "tou", "mv"), 0, match.start()):
+                specificity += 1
+
+    # Pair quotes like '"[^"]+"': an empty pair ("") does not count and its
+    # closing quote may open the next pair
+    i = 0
+    while i < len(quotes) - 1:
+        if quotes[i + 1] > quotes[i] + 1:
+            specificity += 1
+            i += 2
+        else:
+            i += 1
+
+    return _QueryStats(operators, fields, specificity)
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledTerms:
+    """Term and phrase tables of one mapping, with their fused regexes.
+
+    The ``*_sub`` callables are the regex ``sub`` bound to its replacement
+    function, so each conversion pass is one C-level scan that joins the
+    rewritten pieces once, without building a callback per call.
+    """
+
+    sorted_keywords: tuple[tuple[str, str], ...]
+    ja_terms: dict[str, str]
+    ja_terms_re: re.Pattern[str] | None
+    en_terms: tuple[str, ...]
+    en_terms_re: re.Pattern[str] | None
+    phrases: dict[str, str]
+    phrases_re: re.Pattern[str] | None
+    ja_terms_sub: Callable[[str], str] | None
+    en_terms_sub: Callable[[str], str] | None
+    phrases_sub: Callable[[str], str] | None
+    # True when no term or phrase can match pure-ASCII text
+    ascii_inert: bool
+
+
+def _bind_sub(
+    pattern: re.Pattern[str] | None, repl: Callable[[re.Match[str]], str]
+) -> Callable[[str], str] | None:
+    """Bind a replacement function to ``pattern.sub`` (None stays None)."""
+    if pattern is None:
+        return None
+    return partial(pattern.sub, repl)
+
+
+def _prefix_alternation(words: Iterable[str]) -> str:
+    """Return a regex matching the longest of ``words`` at each position.
+
+    The words are factored into a prefix tree (e.g. ``ab|abc|ad`` becomes
+    ``a(?:b(?:c)?|d)``), so the engine reads each character once instead
+    of retrying every word from the same position. Longer words are tried
+    before their prefixes, which equals a longest-first alternation.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = None  # end of a word
+
+    def render(node: dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + render(child) for char, child in node.items() if char
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        # A word may also end here: prefer the longer branches first
+        return group + "?" if "" in node else group
+
+    return render(trie)
+
+
+def _sequential_alternation(terms: Sequence[str]) -> str:
+    """Return a regex replacing ``terms`` like one ``str.replace`` per term.
+
+    ``terms`` are in replacement order (longest first). A plain alternation
+    lets the leftmost match win, while sequential replacement lets an earlier
+    term take text that overlaps the start of a later one (e.g. "セットシンボル"
+    before "最新セット" in "最新セットシンボル" gives "最新s:"). Each term
+    therefore refuses to match where an earlier term, itself not refused,
+    starts inside it and runs past its end, so one scan keeps that result.
+    """
+    patterns: list[str] = []
+    for index, term in enumerate(terms):
+        # Checked after the first character (shared by every blocker), so
+        # each branch still starts with a literal the engine can skip on
+        blockers = [
+            re.escape(term[1:cut]) + patterns[earlier]
+            for earlier, other in enumerate(terms[:index])
+            for cut in range(1, len(term))
+            if other.startswith(term[cut:])
+        ]
+        pattern = re.escape(term)
+        if blockers:
+            pattern = (
+                re.escape(term[0])
+                + "(?!"
+                + "|".join(blockers)
+                + ")"
+                + re.escape(term[1:])
+            )
+        patterns.append(pattern)
+    return "|".join(patterns)
+
+
+def _compile_terms(mapping: LanguageMapping) -> _CompiledTerms:
+    """Sort and compile a mapping's search keywords and phrases.
+
+    Keywords are sorted longest first (to avoid partial replacements) and
+    fused into one alternation, so a single scan replaces every occurrence
+    instead of one pass per term; phrases likewise, factored by prefix.
+    """
+    sorted_keywords = tuple(
+        sorted(mapping.search_keywords.items(), key=lambda x: len(x[0]), reverse=True)
+    )
+    terms = [(term, rep) for term, rep in sorted_keywords if rep]
+    ja_terms: dict[str, str] = {}
+    ja_terms_re: re.Pattern[str] | None = None
+    en_terms: tuple[str, ...] = ()
+    en_terms_re: re.Pattern[str] | None = None
+    if mapping.language_code == "ja":
+        ja_terms = dict(terms)
+        if ja_terms:
+            ja_terms_re = re.compile(_sequential_alternation(tuple(ja_terms)))
+    elif terms:
+        # Whole words, case-insensitive. English terms are single words,
+        # so matches never overlap. One group per term: the replacement is
+        # looked up by group number, which also covers non-ASCII case
+        # variants (e.g. "ſ" for "s") that a lower() lookup would miss.
+        en_terms = tuple(rep for _, rep in terms)
+        en_terms_re = re.compile(
+            r"\b(?:" + "|".join(f"({re.escape(term)})" for term, _ in terms) + r")\b",
+            re.IGNORECASE,
+        )
+
+    phrases = {
+        phrase: replacement
+        for phrase, replacement in sorted(
+            mapping.phrases.items(), key=lambda x: len(x[0]), reverse=True
+        )
+        if _PHRASE_SYNTAX_RE.search(replacement)
+    }
+    phrases_re = re.compile(_prefix_alternation(phrases)) if phrases else None
+
+    return _CompiledTerms(
+        sorted_keywords,
+        ja_terms,
+        ja_terms_re,
+        en_terms,
+        en_terms_re,
+        phrases,
+        phrases_re,
+        ja_terms_sub=_bind_sub(ja_terms_re, lambda m: ja_terms[m.group(0)]),
+        en_terms_sub=_bind_sub(en_terms_re, lambda m: en_terms[(m.lastindex or 1) - 1]),
+        phrases_sub=_bind_sub(phrases_re, lambda m: phrases[m.group(0)]),
+        ascii_inert=not any(
+            key.isascii() for key in (*(term for term, _ in terms), *phrases)
+        ),
+    )
+
+
+def _check_ja_typos(text: str) -> list[str]:
+    """Return a correction suggestion per common misspelling in text.
+
+    One scan finds every misspelling; each is suggested once. The
+    misspellings are hiragana, which has no case, so no lower() is needed
+    and pure-ASCII text is skipped without a scan.
+    """
+    if text.isascii():
+        return []
+    return [
+        f"'{mistake}' を '{_JA_COMMON_MISTAKES[mistake]}' の間違いですか？"
+        for mistake in dict.fromkeys(_JA_MISTAKES_RE.findall(text))
+    ]
+
+
+def _clean_match(match: re.Match[str]) -> str:
+    """Return the replacement for one `_CLEAN_RE` match."""
+    kind = match.lastindex
+    if kind == 1:
+        return ":"
+    if kind == 2:
+        return match.group(2)
+    return " "
 
 
 class QueryBuilder:
@@ -32,15 +311,51 @@ class QueryBuilder:
         "と等しい": "=",
     }
 
-    # Japanese common misspellings (shared across suggestion methods)
-    _JA_COMMON_MISTAKES = {
-        "くりーちゃー": "クリーチャー",
-        "いんすたんと": "インスタント",
-        "そーさりー": "ソーサリー",
-        "あーてぃふぁくと": "アーティファクト",
-        "えんちゃんと": "エンチャント",
+    # Japanese color / card type to Scryfall code (color + type conversion)
+    _JA_COLOR_CODE = {
+        "白": "w",
+        "青": "u",
+        "黒": "b",
+        "赤": "r",
+        "緑": "g",
+        "無色": "c",
+    }
+
+    _JA_TYPE_CODE = {
+        "クリーチャー": "creature",
+        "アーティファクト": "artifact",
+        "エンチャント": "enchantment",
+        "インスタント": "instant",
+        "ソーサリー": "sorcery",
+        "土地": "land",
+        "プレインズウォーカー": "planeswalker",
+    }
+
+    # Every (color, type) pair _COLOR_TYPE_RE can match, rendered once so a
+    # match is a single lookup instead of two lookups and a format
+    _JA_COLOR_TYPE_FILTER = {
+        (color_ja, type_ja): f"c:{color_code} t:{type_code}"
+        for (color_ja, color_code), (type_ja, type_code) in product(
+            _JA_COLOR_CODE.items(), _JA_TYPE_CODE.items()
+        )
+    }
+
+    # Japanese numeric comparison subject to Scryfall field
+    _JA_NUMCMP_FIELD = {
+        "パワー": "p",
+        "タフネス": "tou",
+        "マナ総量": "mv",
+        "点数で見たマナコスト": "cmc",
+        "マナコスト": "m",
     }
 
+    # Converted query strings keyed by (mapping identity, normalized text).
+    # Shared across instances because a builder is created per request; the
+    # mapping is stored with each entry so a reused id() never hits.
+    _query_cache: OrderedDict[tuple[int, str], tuple[LanguageMapping, str]] = (
+        OrderedDict()
+    )
+
     def __init__(self, locale_mapping: LanguageMapping) -> None:
         """Initialize the query builder with locale-specific mappings.
 
@@ -50,17 +365,34 @@ class QueryBuilder:
             Language-specific mappings for query building
         """
         self._mapping = locale_mapping
+        # Locale checked once here instead of per conversion step
+        self._is_ja = locale_mapping.language_code == "ja"
+
+        # Term/phrase tables and their fused regexes; get_query_builder keeps
+        # one builder per locale, so they are compiled once per locale
+        self._terms = _compile_terms(locale_mapping)
 
-        # Initialize pattern matcher for Japanese (Phase 2)
+        # Initialize pattern matcher for Japanese (Phase 2); matchers are
+        # shared per keyword map, so this does not recompile patterns
         self._pattern_matcher: AbilityPatternMatcher | None = None
-        if locale_mapping.language_code == "ja":
-            from .ability_patterns import (
-                AbilityPatternMatcher,
-                create_japanese_patterns,
-            )
+        if self._is_ja:
+            self._pattern_matcher = get_japanese_matcher(locale_mapping.search_keywords)
+
+        # Conversion pipeline specialized to the locale once, so English
+        # queries never reach the Japanese-only passes
+        self._pipeline: Callable[[str], str] = (
+            self._convert_query_ja if self._is_ja else self._convert_query_en
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized query strings and shared builders.
 
-            patterns = create_japanese_patterns(locale_mapping.search_keywords)
-            self._pattern_matcher = AbilityPatternMatcher(patterns)
+        Needed only when a mapping object is modified in place; mappings are
+        otherwise fixed, so cached conversions stay valid.
+        """
+        cls._query_cache.clear()
+        _BUILDERS.clear()
 
     def build(self, parsed: ParsedQuery) -> BuiltQuery:
         """Build Scryfall query from parsed data.
@@ -80,29 +412,7 @@ class QueryBuilder:
         BuiltQuery
             Built query with metadata and suggestions
         """
-        # Phase 2: Apply pattern matching FIRST (before other conversions)
-        # This prevents other conversions from interfering with pattern matching
-        ability_tokens: list[str] = []
-        working_text = parsed.normalized_text
-        if self._pattern_matcher is not None:
-            working_text, ability_tokens = self._pattern_matcher.apply(working_text)
-
-        # Start with normalized text and apply transformations
-        # IMPORTANT: _convert_operators must run before _convert_basic_terms
-        # to handle patterns like "パワー3以上" before "パワー" gets converted to "p"
-        # Card names and card types are intentionally passed through unchanged:
-        # Scryfall natively matches multilingual names (printed_name + lang:),
-        # and type words are converted as part of _convert_colors.
-        query = self._convert_operators(working_text)
-        query = self._convert_colors(query)
-        query = self._convert_basic_terms(query)
-        query = self._convert_phrases(query)
-
-        # Add ability tokens from Phase 2 pattern matching
-        if ability_tokens:
-            query = f"{query} {' '.join(ability_tokens)}"
-
-        query = self._clean_query(query)
+        query = self._cached_query(parsed.normalized_text)
 
         # Generate suggestions based on parsed data
         suggestions = self._generate_suggestions(parsed)
@@ -117,139 +427,163 @@ class QueryBuilder:
             query_metadata=metadata,
         )
 
-    def _convert_basic_terms(self, text: str) -> str:
-        """Convert basic search terms.
+    def _cached_query(self, text: str) -> str:
+        """Return the converted query for text, memoizing recent results.
 
         Parameters
         ----------
         text : str
-            Input text
+            Normalized query text
 
         Returns
         -------
         str
-            Text with converted basic terms
+            Scryfall query (placeholders such as ``__LATEST_SET__`` unresolved)
         """
-        # Sort terms by length (longest first) to avoid partial replacements
-        sorted_terms = sorted(
-            self._mapping.search_keywords.items(), key=lambda x: len(x[0]), reverse=True
-        )
-
-        for term, scryfall_term in sorted_terms:
-            if scryfall_term:  # Only replace if there's a mapping
-                # For Japanese text, use simple replacement
-                # For English, use word boundaries
-                if self._mapping.language_code == "ja":
-                    text = text.replace(term, scryfall_term)
-                else:
-                    pattern = rf"\b{re.escape(term)}\b"
-                    text = re.sub(pattern, scryfall_term, text, flags=re.IGNORECASE)
+        cache = self._query_cache
+        key = (id(self._mapping), text)
+        entry = cache.get(key)
+        if entry is not None and entry[0] is self._mapping:
+            cache.move_to_end(key)
+            return entry[1]
+
+        query = self._pipeline(text)
+        cache[key] = (self._mapping, query)
+        if len(cache) > _QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return query
 
-        return text
+    def _convert_query_en(self, text: str) -> str:
+        """Run the conversion pipeline for word-boundary locales (English).
 
-    def _convert_colors(self, text: str) -> str:
-        """Convert color references.
+        Only dictionary conversions apply; the Japanese pattern matcher,
+        numeric comparison and color/type passes are skipped.
 
         Parameters
         ----------
         text : str
-            Input text
+            Normalized query text
 
         Returns
         -------
         str
-            Text with converted colors
+            Scryfall query
         """
-        # Handle Japanese color patterns
-        if self._mapping.language_code == "ja":
-            # Pattern: "白いクリーチャー" -> "c:w t:creature"
-            color_creature_pattern = r"(白|青|黒|赤|緑|無色)い?の?(クリーチャー|アーティファクト|エンチャント|インスタント|ソーサリー|土地|プレインズウォーカー)"
-
-            def replace_color_type(match: Any) -> str:
-                color_ja, type_ja = match.groups()
-                color_code = {
-                    "白": "w",
-                    "青": "u",
-                    "黒": "b",
-                    "赤": "r",
-                    "緑": "g",
-                    "無色": "c",
-                }.get(color_ja, "")
-
-                type_code = {
-                    "クリーチャー": "creature",
-                    "アーティファクト": "artifact",
-                    "エンチャント": "enchantment",
-                    "インスタント": "instant",
-                    "ソーサリー": "sorcery",
-                    "土地": "land",
-                    "プレインズウォーカー": "planeswalker",
-                }.get(type_ja, "")
-
-                return f"c:{color_code} t:{type_code}"
-
-            text = re.sub(color_creature_pattern, replace_color_type, text)
-
-        return text
-
-    def _convert_operators(self, text: str) -> str:
-        """Convert comparison operators.
+        # Phrases run first: single-word terms would otherwise break them up
+        # (e.g. "price" -> "usd" before "price under" -> "usd<" can match)
+        query = self._convert_phrases(text)
+        query = self._convert_basic_terms(query)
+        return self._clean_query(query)
+
+    def _convert_query_ja(self, text: str) -> str:
+        """Run the full Japanese conversion pipeline on normalized text.
 
         Parameters
         ----------
         text : str
-            Input text
+            Normalized query text
 
         Returns
         -------
         str
-            Text with converted operators
+            Scryfall query
         """
-        if self._mapping.language_code == "ja":
-            # Handle Japanese numeric comparisons
-            # Pattern: "パワーが3以上" -> "p>=3"
-            power_pattern = r"パワーが?(\d+)(以上|以下|より大きい|未満|と?等しい)?"
+        # Pasted Scryfall syntax (pure ASCII) cannot match any Japanese
+        # pattern, term or phrase: only the final cleanup applies
+        if self._terms.ascii_inert and text.isascii():
+            return self._clean_query(text)
 
-            def replace_power(match: Any) -> str:
-                number, operator_ja = match.groups()
-                operator = self._JA_OPERATOR_MAP.get(operator_ja or "等しい", "=")
-
-                return f"p{operator}{number}"
+        # Phase 2: Apply pattern matching FIRST (before other conversions)
+        # This prevents other conversions from interfering with pattern matching
+        ability_tokens: list[str] = []
+        if self._pattern_matcher is not None:
+            text, ability_tokens = self._pattern_matcher.apply(text)
 
-            text = re.sub(power_pattern, replace_power, text)
+        # Start with normalized text and apply transformations
+        # IMPORTANT: operators (_convert_filters) must run before
+        # _convert_basic_terms to handle patterns like "パワー3以上" before
+        # "パワー" gets converted to "p"
+        # Card names and card types are intentionally passed through unchanged:
+        # Scryfall natively matches multilingual names (printed_name + lang:),
+        # and type words are converted together with colors.
+        query = self._convert_filters(text)
+        query = self._convert_basic_terms(query)
+        query = self._convert_phrases(query)
 
-            # Similar for toughness
-            toughness_pattern = (
-                r"タフネスが?(\d+)(以上|以下|より大きい|未満|と?等しい)?"
-            )
+        # Add ability tokens from Phase 2 pattern matching (one join)
+        if ability_tokens:
+            query = " ".join([query, *ability_tokens])
 
-            def replace_toughness(match: Any) -> str:
-                number, operator_ja = match.groups()
-                operator = self._JA_OPERATOR_MAP.get(operator_ja or "等しい", "=")
+        return self._clean_query(query)
 
-                return f"tou{operator}{number}"
+    def _convert_basic_terms(self, text: str) -> str:
+        """Convert basic search terms.
 
-            text = re.sub(toughness_pattern, replace_toughness, text)
+        Parameters
+        ----------
+        text : str
+            Input text
 
-            # Mana cost patterns
-            mana_pattern = r"(マナ総量|点数で見たマナコスト|マナコスト)が?(\d+)(以上|以下|より大きい|未満|と?等しい)?"
+        Returns
+        -------
+        str
+            Text with converted basic terms
+        """
+        # For English, use word boundaries (one scan, see __init__)
+        if not self._is_ja:
+            en_terms_sub = self._terms.en_terms_sub
+            if en_terms_sub is None:
+                return text
+            return en_terms_sub(text)
+
+        # For Japanese text, use simple replacement in a single scan
+        ja_terms_sub = self._terms.ja_terms_sub
+        if ja_terms_sub is None:
+            return text
+        return ja_terms_sub(text)
+
+    def _replace_color_type(self, match: re.Match[str]) -> str:
+        """Return the Scryfall filters for one `_COLOR_TYPE_RE` match."""
+        return self._JA_COLOR_TYPE_FILTER[match["color"], match["type"]]
+
+    def _replace_comparison(self, match: re.Match[str]) -> str:
+        """Return the Scryfall comparison for one `_NUMCMP_RE` match."""
+        subject, number, operator_ja = (
+            match["subject"],
+            match["number"],
+            match["operator"],
+        )
+        field = self._JA_NUMCMP_FIELD[subject]
+        # No operator word means equality
+        operator = self._JA_OPERATOR_MAP.get(operator_ja, "=")
 
-            def replace_mana(match: Any) -> str:
-                cost_type, number, operator_ja = match.groups()
+        return f"{field}{operator}{number}"
 
-                field = "mv"  # Default to mana value
-                if cost_type == "点数で見たマナコスト":
-                    field = "cmc"
-                elif cost_type == "マナコスト":
-                    field = "m"
+    def _convert_filters(self, text: str) -> str:
+        """Convert Japanese numeric comparisons and color/type pairs at once.
 
-                operator = self._JA_OPERATOR_MAP.get(operator_ja or "等しい", "=")
+        Pattern: "パワーが3以上" -> "p>=3", "白いクリーチャー" -> "c:w t:creature",
+        both handled by the single `_JA_FILTER_RE` scan.
 
-                return f"{field}{operator}{number}"
+        Parameters
+        ----------
+        text : str
+            Input text
 
-            text = re.sub(mana_pattern, replace_mana, text)
+        Returns
+        -------
+        str
+            Text with converted comparisons and colors
+        """
+        if text.isascii():
+            return text
+        return _JA_FILTER_RE.sub(self._replace_filter, text)
 
-        return text
+    def _replace_filter(self, match: re.Match[str]) -> str:
+        """Dispatch one `_JA_FILTER_RE` match to its replacement."""
+        if match["subject"] is not None:
+            return self._replace_comparison(match)
+        return self._replace_color_type(match)
 
     def _convert_phrases(self, text: str) -> str:
         """Convert common phrases using dictionary replacements.
@@ -267,12 +601,11 @@ class QueryBuilder:
         str
             Text with converted phrases
         """
-        # Dictionary-based replacement (Phase 1)
-        for phrase, replacement in self._mapping.phrases.items():
-            if replacement:  # Only replace if there's a mapping
-                text = text.replace(phrase, replacement)
-
-        return text
+        # Dictionary-based replacement (Phase 1), all phrases in one scan
+        phrases_sub = self._terms.phrases_sub
+        if phrases_sub is None:
+            return text
+        return phrases_sub(text)
 
     def _clean_query(self, query: str) -> str:
         """Clean up the final query.
@@ -287,17 +620,7 @@ class QueryBuilder:
         str
             Cleaned query
         """
-        # Remove extra spaces
-        query = re.sub(r"\s+", " ", query.strip())
-
-        # Remove redundant operators
-        query = re.sub(r"\s+(and|or)\s+", r" \1 ", query)
-
-        # Clean up any remaining artifacts
-        query = re.sub(r"\s*:\s*", ":", query)
-        query = re.sub(r"\s*([<>=!]+)\s*", r"\1", query)
-
-        return query
+        return _CLEAN_RE.sub(_clean_match, query.strip())
 
     def _generate_suggestions(self, parsed: ParsedQuery) -> list[str]:
         """Generate suggestions based on parsed query data.
@@ -318,7 +641,7 @@ class QueryBuilder:
 
         # Suggest more specific searches
         if not entities["colors"] and not entities["types"]:
-            if self._mapping.language_code == "ja":
+            if self._is_ja:
                 suggestions.append(
                     "色やカードタイプを指定すると、より具体的な検索ができます"
                 )
@@ -328,11 +651,8 @@ class QueryBuilder:
                 )
 
         # Suggest format restrictions for competitive queries
-        if any(
-            word in text.lower()
-            for word in ["tournament", "competitive", "meta", "tier"]
-        ):
-            if self._mapping.language_code == "ja":
+        if COMPETITIVE_RE.search(text):
+            if self._is_ja:
                 suggestions.append(
                     "競技用検索には f:standard や f:modern などでフォーマットを指定してみてください"
                 )
@@ -342,12 +662,8 @@ class QueryBuilder:
                 )
 
         # Check for common misspellings in Japanese
-        if self._mapping.language_code == "ja":
-            for mistake, correction in self._JA_COMMON_MISTAKES.items():
-                if mistake in text.lower():
-                    suggestions.append(
-                        f"'{mistake}' を '{correction}' の間違いですか？"
-                    )
+        if self._is_ja:
+            suggestions.extend(_check_ja_typos(text))
 
         return suggestions
 
@@ -368,29 +684,35 @@ class QueryBuilder:
         dict
             Query metadata
         """
+        # Both heuristics share one scan of the built query
+        stats = _scan_query_stats(built_query)
         return {
             "intent": parsed.intent,
             "extracted_entities": parsed.entities,
             "language": parsed.language,
-            "query_complexity": self._assess_complexity(built_query),
-            "estimated_results": self._estimate_results(built_query),
+            "query_complexity": self._assess_complexity(built_query, stats),
+            "estimated_results": self._estimate_results(built_query, stats),
         }
 
-    def _assess_complexity(self, query: str) -> str:
+    def _assess_complexity(self, query: str, stats: _QueryStats | None = None) -> str:
         """Assess the complexity of a query.
 
         Parameters
         ----------
         query : str
             Scryfall query
+        stats : _QueryStats, optional
+            Precomputed counts for ``query``; scanned when omitted
 
         Returns
         -------
         str
             Complexity assessment
         """
-        operator_count = len(re.findall(r"[<>=!]+", query))
-        field_count = len(re.findall(r"\w+:", query))
+        if stats is None:
+            stats = _scan_query_stats(query)
+        operator_count = stats.operators
+        field_count = stats.fields
 
         if operator_count > 3 or field_count > 5:
             return "complex"
@@ -399,13 +721,15 @@ class QueryBuilder:
         else:
             return "simple"
 
-    def _estimate_results(self, query: str) -> str:
+    def _estimate_results(self, query: str, stats: _QueryStats | None = None) -> str:
         """Estimate the number of results for a query.
 
         Parameters
         ----------
         query : str
             Scryfall query
+        stats : _QueryStats, optional
+            Precomputed counts for ``query``; scanned when omitted
 
         Returns
         -------
@@ -413,15 +737,9 @@ class QueryBuilder:
             Result count estimation
         """
         # This is a simple heuristic - more specific queries usually return fewer results
-        specificity_score = 0
-
-        # Count specific filters
-        specificity_score += len(re.findall(r"c:", query))  # Colors
-        specificity_score += len(re.findall(r"t:", query))  # Types
-        specificity_score += len(re.findall(r"p[<>=!]", query))  # Power
-        specificity_score += len(re.findall(r"tou[<>=!]", query))  # Toughness
-        specificity_score += len(re.findall(r"mv[<>=!]", query))  # Mana value
-        specificity_score += len(re.findall(r'"[^"]+"', query))  # Quoted names
+        if stats is None:
+            stats = _scan_query_stats(query)
+        specificity_score = stats.specificity
 
         if specificity_score >= 4:
             return "few"
@@ -429,3 +747,30 @@ class QueryBuilder:
             return "moderate"
         else:
             return "many"
+
+
+# Shared builders keyed by language code. A builder holds no per-query state
+# (its tables are fixed at init), so one instance per locale serves every
+# request.
+_BUILDERS: dict[str, QueryBuilder] = {}
+
+
+def get_query_builder(mapping: LanguageMapping) -> QueryBuilder:
+    """Return the shared query builder for a mapping.
+
+    Parameters
+    ----------
+    mapping : LanguageMapping
+        Language mapping the builder converts with
+
+    Returns
+    -------
+    QueryBuilder
+        Builder reused across calls; rebuilt if the locale's mapping object
+        was replaced (e.g. after a mapping reload)
+    """
+    builder = _BUILDERS.get(mapping.language_code)
+    if builder is None or builder._mapping is not mapping:
+        builder = QueryBuilder(mapping)
+        _BUILDERS[mapping.language_code] = builder
+    return builder
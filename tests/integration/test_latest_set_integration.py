@@ -208,3 +208,28 @@ class TestLatestSetIntegration:
             # The query should be just "s:spm", not "s:spm lang:ja"
             assert resolved == "s:spm"
             assert "lang:" not in resolved
+
+    @pytest.mark.asyncio
+    async def test_resolve_placeholder_without_placeholder_skips_api(self):
+        """Test queries without the placeholder are returned as is."""
+        with patch("scryfall_mcp.api.client.get_client") as mock_get_client:
+            resolved = await resolve_latest_set_placeholder("c:r t:creature")
+
+        assert resolved == "c:r t:creature"
+        mock_get_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resolve_placeholder_replaces_every_occurrence(self):
+        """Test every placeholder in the query is replaced."""
+        with (
+            patch(
+                "scryfall_mcp.api.sets.get_latest_expansion_code",
+                AsyncMock(return_value="spm"),
+            ),
+            patch("scryfall_mcp.api.client.get_client", AsyncMock()),
+        ):
+            resolved = await resolve_latest_set_placeholder(
+                "t:creature s:__LATEST_SET__ or s:__LATEST_SET__"
+            )
+
+        assert resolved == "t:creature s:spm or s:spm"
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import re
+
 import pytest
 
 from scryfall_mcp.i18n import get_current_mapping, set_current_locale
 from scryfall_mcp.search.ability_patterns import (
+    AbilityPattern,
     AbilityPatternMatcher,
     create_japanese_patterns,
+    get_japanese_matcher,
 )
 
 
@@ -213,3 +217,188 @@ class TestAbilityPatternMatcher:
 
         assert remaining.strip() == ""
         assert tokens == []
+
+    def test_effect_tokens_are_unique(self):
+        """Test that overlapping effect phrases yield a single token."""
+        text = "死亡時に破壊する黒いクリーチャー"
+        remaining, tokens = self.matcher.apply(text)
+
+        assert tokens == ['o:"when ~ dies"', 'o:"destroy"']
+
+    def test_effect_tokens_follow_text_order(self):
+        """Test that effect tokens are emitted in order of appearance."""
+        text = "死亡時に追放しカードを1枚引く黒いクリーチャー"
+        remaining, tokens = self.matcher.apply(text)
+
+        assert tokens == ['o:"when ~ dies"', 'o:"exile"', 'o:"draw a card"']
+
+    def test_longest_effect_phrase_wins(self):
+        """Test that the longest known phrase is matched at a position."""
+        patterns = create_japanese_patterns({})
+        matcher = AbilityPatternMatcher(patterns)
+
+        remaining, tokens = matcher.apply("死亡時にカードを2枚引く黒いクリーチャー")
+
+        assert tokens == ['o:"when ~ dies"', 'o:"draw two cards"']
+
+    def test_ability_pattern_is_immutable(self):
+        """Test that AbilityPattern instances are frozen and slotted."""
+        pattern = create_japanese_patterns({})[0]
+
+        assert not hasattr(pattern, "__dict__")
+        with pytest.raises(AttributeError):
+            pattern.priority = 0  # type: ignore[misc]
+
+    def test_effect_with_surrounding_spaces(self):
+        """Test that spaces around the effect do not break effect parsing."""
+        patterns = create_japanese_patterns({})
+        matcher = AbilityPatternMatcher(patterns)
+
+        remaining, tokens = matcher.apply("死亡時に　カードを1枚引く 黒いクリーチャー")
+
+        assert tokens == ['o:"when ~ dies"', 'o:"draw a card"']
+        assert remaining == "黒いクリーチャー"
+
+
+class TestGetJapaneseMatcher:
+    """Test the shared matcher factory."""
+
+    def test_same_keyword_map_returns_shared_matcher(self):
+        """Test that equal keyword maps share one matcher instance."""
+        keyword_map = {"死亡時": 'o:"dies"'}
+
+        first = get_japanese_matcher(keyword_map)
+        second = get_japanese_matcher(dict(keyword_map))
+
+        assert first is second
+
+    def test_different_keyword_maps_get_distinct_matchers(self):
+        """Test that distinct keyword maps are not conflated."""
+        first = get_japanese_matcher({"a": "b"})
+        second = get_japanese_matcher({"a": "c"})
+
+        assert first is not second
+
+    def test_keyword_map_is_honored(self):
+        """Test that the matcher uses the given keyword map for exact effects."""
+        matcher = get_japanese_matcher({"謎の効果": 'o:"mystery"'})
+
+        _, tokens = matcher.apply("死亡時に謎の効果する")
+
+        assert tokens == ['o:"when ~ dies"', 'o:"mystery"']
+
+    def test_trigger_patterns_have_anchor(self):
+        """Test that every trigger pattern carries its literal anchor."""
+        for pattern in create_japanese_patterns({}):
+            assert pattern.anchor
+            assert pattern.pattern.pattern.startswith(pattern.anchor)
+
+    def test_trigger_after_long_prefix(self):
+        """Test that a trigger near the end of long text is still matched."""
+        matcher = get_japanese_matcher({})
+        text = "伝説の " * 20 + "死亡時にカードを引く"
+
+        remaining, tokens = matcher.apply(text)
+
+        assert tokens == ['o:"when ~ dies"', 'o:"draw"']
+        assert "死亡時" not in remaining
+
+    def test_repeated_effects_reuse_parse_result(self):
+        """Test that repeated effect text yields identical tokens each time."""
+        matcher = get_japanese_matcher({})
+        text = "死亡時にカードを1枚引く黒いクリーチャー"
+
+        first = matcher.apply(text)
+        second = matcher.apply(text)
+
+        assert first == second
+        assert first[1] == ['o:"when ~ dies"', 'o:"draw a card"']
+
+    def test_single_scan_emits_tokens_in_text_order(self):
+        """Test that triggers of different patterns come out in text order."""
+        matcher = get_japanese_matcher({})
+        text = "攻撃したときにカードを引く 死亡時にライフを得るクリーチャー"
+
+        remaining, tokens = matcher.apply(text)
+
+        assert tokens == [
+            'o:"whenever ~ attacks"',
+            'o:"draw"',
+            'o:"when ~ dies"',
+            'o:"gain life"',
+        ]
+        assert remaining == "クリーチャー"
+
+    @pytest.mark.parametrize(
+        ("text", "expected_tokens", "expected_remaining"),
+        [
+            (
+                "戦場に出たときにカードを引く死亡時にライフを得る",
+                [
+                    'o:"enters the battlefield"',
+                    'o:"draw"',
+                    'o:"when ~ dies"',
+                    'o:"gain life"',
+                ],
+                "",
+            ),
+            (
+                "攻撃したときに破壊する戦場に出たときにカードを引くクリーチャー",
+                [
+                    'o:"whenever ~ attacks"',
+                    'o:"destroy"',
+                    'o:"enters the battlefield"',
+                    'o:"draw"',
+                ],
+                "クリーチャー",
+            ),
+            (
+                "戦場に出たときに死亡時にカードを引く",
+                ['o:"enters the battlefield"', 'o:"when ~ dies"', 'o:"draw"'],
+                "",
+            ),
+        ],
+    )
+    def test_chained_triggers_without_spaces(
+        self, text, expected_tokens, expected_remaining
+    ):
+        """Test an effect never swallows a directly following trigger."""
+        matcher = get_japanese_matcher({})
+
+        remaining, tokens = matcher.apply(text)
+
+        assert tokens == expected_tokens
+        assert remaining == expected_remaining
+
+    def test_patterns_without_anchor_scan_whole_text(self):
+        """Test that custom patterns without an anchor are still applied."""
+        pattern = AbilityPattern(
+            name="flying",
+            pattern=re.compile(r"飛ぶ(もの)"),
+            replacement=lambda match: (f"kw:{match.group(1)}",),
+        )
+        matcher = AbilityPatternMatcher([pattern])
+
+        remaining, tokens = matcher.apply("空を飛ぶもの")
+
+        assert tokens == ["kw:もの"]
+        assert remaining == "空を"
+
+    def test_dispatch_with_inner_groups(self):
+        """Test that patterns with inner groups dispatch to the right pattern."""
+        first = AbilityPattern(
+            name="first",
+            pattern=re.compile(r"(赤)(い)"),
+            replacement=lambda match: (f"first:{match.group(1)}",),
+        )
+        second = AbilityPattern(
+            name="second",
+            pattern=re.compile(r"(青)(い)"),
+            replacement=lambda match: (f"second:{match.group(2)}",),
+        )
+        matcher = AbilityPatternMatcher([first, second])
+
+        remaining, tokens = matcher.apply("青い 赤い 青い")
+
+        assert tokens == ["second:い", "first:赤", "second:い"]
+        assert remaining == ""
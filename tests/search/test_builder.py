@@ -9,10 +9,24 @@ transformation and leaves the __LATEST_SET__ placeholder untouched
 
 from __future__ import annotations
 
+import re
+from collections import OrderedDict
+
 import pytest
 
-from scryfall_mcp.i18n import get_current_mapping, set_current_locale
-from scryfall_mcp.search.builder import QueryBuilder
+from scryfall_mcp.i18n import (
+    english_mapping,
+    get_current_mapping,
+    set_current_locale,
+)
+from scryfall_mcp.search.ability_patterns import AbilityPatternMatcher
+from scryfall_mcp.search.builder import (
+    QueryBuilder,
+    _prefix_alternation,
+    _scan_query_stats,
+    _sequential_alternation,
+    get_query_builder,
+)
 from scryfall_mcp.search.parser import SearchParser
 
 
@@ -50,6 +64,21 @@ class TestQueryBuilder:
         assert query_builder._mapping is not None
         assert query_builder._mapping.language_code == "en"
 
+    def test_initialization_caches_sorted_keywords(self, query_builder, ja_builder):
+        """Test keyword order and term scanners are prepared once."""
+        lengths = [len(term) for term, _ in ja_builder._terms.sorted_keywords]
+        assert lengths == sorted(lengths, reverse=True)
+        assert ja_builder._terms.ja_terms_re is not None
+        assert ja_builder._terms.en_terms_re is None
+
+        assert query_builder._terms.ja_terms_re is None
+        assert query_builder._terms.en_terms_re is not None
+        assert len(query_builder._terms.en_terms) == sum(
+            1
+            for _, scryfall_term in query_builder._terms.sorted_keywords
+            if scryfall_term
+        )
+
     def test_build_pipeline_english(self, query_builder):
         """Test query building in English via the real pipeline."""
         # Simple search
@@ -82,7 +111,7 @@ class TestQueryBuilder:
         assert "p>=3" in result
         assert "tou<=5" in result
 
-    def test_convert_colors_japanese(self, ja_builder):
+    def test_convert_filters_colors_japanese(self, ja_builder):
         """Test Japanese color conversion."""
         test_cases = [
             ("白いクリーチャー", "c:w t:creature"),
@@ -93,10 +122,10 @@ class TestQueryBuilder:
         ]
 
         for input_text, expected_part in test_cases:
-            result = ja_builder._convert_colors(input_text)
+            result = ja_builder._convert_filters(input_text)
             assert expected_part in result
 
-    def test_convert_operators_japanese(self, ja_builder):
+    def test_convert_filters_operators_japanese(self, ja_builder):
         """Test Japanese operator conversion."""
         test_cases = [
             ("パワーが3以上", "p>=3"),
@@ -110,7 +139,7 @@ class TestQueryBuilder:
         ]
 
         for input_text, expected in test_cases:
-            result = ja_builder._convert_operators(input_text)
+            result = ja_builder._convert_filters(input_text)
             assert expected in result
 
     def test_japanese_card_names_pass_through(self, ja_builder):
@@ -147,6 +176,60 @@ class TestQueryBuilder:
             if expected_part:  # Some phrases map to empty string
                 assert expected_part in result
 
+    def test_convert_phrases_longest_phrase_wins(self, query_builder, ja_builder):
+        """Test phrases replace longest-first without re-replacing output."""
+        # "costs under" wins over its prefix "costs"; "usd<" is not rewritten
+        assert query_builder._convert_phrases("costs under") == "usd<"
+        assert query_builder._convert_phrases("price under") == "usd<"
+        assert ja_builder._convert_phrases("フレーバーテキストに") == "ft:"
+
+    def test_convert_phrases_skips_display_labels(self, query_builder, ja_builder):
+        """Test UI labels and messages in the phrase tables are not applied."""
+        assert query_builder._convert_phrases("flavor text info") == "ft: info"
+        assert query_builder._convert_phrases("no results found") == "no results found"
+        assert ja_builder._convert_phrases("通貨ドル") == "通貨ドル"
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("price under 5", "usd<5"),
+            ("costs under 3", "usd<3"),
+            ("creatures with power less than 2", "t:creature p<2"),
+            ("mana cost 3", "m:3"),
+            ("flavor text info", "ft:info"),
+        ],
+    )
+    def test_english_phrases_convert_before_terms(self, query_builder, text, expected):
+        """Test English phrases are not broken up by single-word terms."""
+        assert build_text(query_builder, text) == expected
+
+    def test_prefix_alternation_prefers_longest_word(self):
+        """Test the prefix-factored regex matches like a longest-first one."""
+        words = ["ab", "abcd", "abce", "ad", "b", "a.b"]
+        pattern = re.compile(_prefix_alternation(words))
+        assert pattern.pattern == r"(?:a(?:b(?:c(?:d|e))?|d|\.b)|b)"
+        assert pattern.findall("abcx abcd ad a.b axb") == [
+            "ab",
+            "abcd",
+            "ad",
+            "a.b",
+            "b",
+        ]
+
+    def test_sequential_alternation_matches_sequential_replace(self):
+        """Test an earlier term wins over a later term overlapping its start."""
+        terms = ("cdef", "bcd", "abc", "ab")
+        pattern = re.compile(_sequential_alternation(terms))
+        text = "abcdef abcd abc ab"
+
+        expected = text
+        for term in terms:
+            expected = expected.replace(term, term.upper())
+
+        assert pattern.sub(lambda m: m.group(0).upper(), text) == expected
+        # "bcd" loses to "cdef", which frees "ab" in "abcdef"
+        assert expected == "ABCDEF aBCD ABC AB"
+
     def test_clean_query(self, query_builder):
         """Test query cleaning."""
         test_cases = [
@@ -219,6 +302,110 @@ class TestQueryBuilder:
             result = ja_builder._convert_basic_terms(ja_term)
             assert expected in result
 
+    def test_build_memoizes_query_across_instances(self, ja_builder, mocker):
+        """Test identical inputs reuse the converted query string."""
+        first = build_text(ja_builder, "パワー3以上の赤いクリーチャー")
+
+        other = QueryBuilder(ja_builder._mapping)
+        pipeline = mocker.patch.object(other, "_pipeline")
+        assert build_text(other, "パワー3以上の赤いクリーチャー") == first
+        pipeline.assert_not_called()
+
+    def test_clear_cache_drops_memoized_queries(self, query_builder, mocker):
+        """Test clear_cache forces the next build to convert again."""
+        build_text(query_builder, "white creatures")
+        QueryBuilder.clear_cache()
+
+        pipeline = mocker.patch.object(
+            query_builder, "_pipeline", return_value="c:w t:creature"
+        )
+        assert build_text(query_builder, "white creatures") == "c:w t:creature"
+        pipeline.assert_called_once()
+
+    def test_compiled_terms_shared_per_mapping(self, ja_builder):
+        """Test the shared builder compiles its term tables once per locale."""
+        mapping = ja_builder._mapping
+        terms = get_query_builder(mapping)._terms
+        assert get_query_builder(mapping)._terms is terms
+
+        QueryBuilder.clear_cache()
+        rebuilt = get_query_builder(mapping)._terms
+        assert rebuilt is not terms
+        assert rebuilt.phrases == terms.phrases
+
+    def test_get_query_builder_shares_instance_per_mapping(self, ja_builder):
+        """Test the factory reuses one builder per locale mapping."""
+        mapping = ja_builder._mapping
+        builder = get_query_builder(mapping)
+        assert get_query_builder(mapping) is builder
+        assert get_query_builder(english_mapping) is not builder
+
+        QueryBuilder.clear_cache()
+        assert get_query_builder(mapping) is not builder
+
+    def test_query_cache_is_bounded(self, query_builder, mocker):
+        """Test the query cache evicts its oldest entries."""
+        mocker.patch("scryfall_mcp.search.builder._QUERY_CACHE_SIZE", 2)
+        cache = mocker.patch.object(QueryBuilder, "_query_cache", OrderedDict())
+        for text in ("bolt", "counterspell", "giant growth"):
+            query_builder._cached_query(text)
+
+        assert len(cache) <= 2
+        assert (id(query_builder._mapping), "bolt") not in cache
+
+    def test_convert_basic_terms_english_whole_words_single_scan(self, query_builder):
+        """Test English terms convert as whole, case-insensitive words."""
+        result = query_builder._convert_basic_terms("Colors power-Toughness colorsx")
+        assert result == "c p-tou colorsx"
+
+    def test_convert_basic_terms_english_matches_per_term_replacement(
+        self, query_builder
+    ):
+        """Test the single scan agrees with replacing each term in turn."""
+        import re
+
+        def per_term(text: str) -> str:
+            for term, scryfall_term in query_builder._terms.sorted_keywords:
+                if scryfall_term:
+                    pattern = rf"\b{re.escape(term)}\b"
+                    text = re.sub(pattern, scryfall_term, text, flags=re.IGNORECASE)
+            return text
+
+        terms = [term for term, _ in query_builder._terms.sorted_keywords]
+        samples = [
+            " ".join(terms),
+            "-".join(term.upper() for term in terms),
+            ":".join(f"{term}s" for term in terms),
+        ]
+        for sample in samples:
+            assert query_builder._convert_basic_terms(sample) == per_term(sample)
+
+    def test_basic_term_conversion_longest_term_wins(self, ja_builder):
+        """Test the longest term wins where terms share a prefix."""
+        result = ja_builder._convert_basic_terms("セットシンボル 飛行クリーチャー")
+        assert result == "s: keyword:flyingt:creature"
+
+    @pytest.mark.parametrize(
+        ("ja_text", "expected"),
+        [
+            # "セットシンボル" is replaced before "最新セット" can match
+            ("最新セットシンボル", "最新s:"),
+            ("神話レアーティファクト", "神話レt:artifact"),
+        ],
+    )
+    def test_basic_term_conversion_overlapping_terms(
+        self, ja_builder, ja_text, expected
+    ):
+        """Test overlapping terms keep the longest-first replacement order."""
+        sequential = ja_text
+        for term, scryfall_term in ja_builder._terms.sorted_keywords:
+            if scryfall_term:
+                sequential = sequential.replace(term, scryfall_term)
+
+        result = ja_builder._convert_basic_terms(ja_text)
+        assert result == sequential
+        assert result == expected
+
     def test_japanese_keyword_ability_search_single(self, ja_builder):
         """Test Japanese keyword ability search - single keyword.
 
@@ -648,6 +835,23 @@ class TestQueryBuilder:
         result = ja_builder.build(parsed)
         assert any("クリーチャー" in s for s in result.suggestions)
 
+    def test_generate_suggestions_japanese_misspellings_once_each(self, ja_builder):
+        """Test each distinct misspelling is suggested exactly once."""
+        from scryfall_mcp.models import ParsedQuery
+
+        text = "くりーちゃー いんすたんと くりーちゃー"
+        parsed = ParsedQuery(
+            original_text=text,
+            normalized_text=text,
+            intent="search_cards",
+            language="ja",
+            entities={"colors": [], "types": []},
+        )
+
+        suggestions = ja_builder.build(parsed).suggestions
+        assert sum("くりーちゃー" in s for s in suggestions) == 1
+        assert sum("いんすたんと" in s for s in suggestions) == 1
+
     def test_assess_complexity_simple(self, query_builder):
         """Test complexity assessment for simple queries."""
         simple_query = "c:w t:creature"
@@ -686,6 +890,18 @@ class TestQueryBuilder:
         estimate = query_builder._estimate_results(broad_query)
         assert estimate == "many"
 
+    def test_scan_query_stats_counts_overlapping_filters(self):
+        """Test the single metadata scan counts filters inside fields/operators."""
+        stats = _scan_query_stats('c:r t:creature p>=3 tou<2 mv!=1 "a:b" "" set:x')
+        assert stats.operators == 3
+        assert stats.fields == 4  # c:, t:, a: (inside quotes), set:
+        assert stats.specificity == 7  # c:, t:, set: (ends in t:), p, tou, mv, quote
+
+    def test_scan_query_stats_memoized(self):
+        """Test repeated built queries reuse their (immutable) stats."""
+        query = "c:g t:elf pow>=2"
+        assert _scan_query_stats(query) is _scan_query_stats(query)
+
     def test_convert_basic_terms_english(self, query_builder):
         """Test basic term conversion for English."""
         # English should use word boundaries
@@ -704,11 +920,75 @@ class TestQueryBuilder:
         result = build_text(ja_builder, "パワー＝３")
         assert "p=3" in result
 
-    def test_convert_operators_mana_cost_m_field(self, ja_builder):
+    def test_nfkc_normalization_japanese_pipeline(self, ja_builder):
+        """Test half-width katakana and full-width letters are normalized."""
+        result = build_text(ja_builder, "ｸﾘｰﾁｬｰ　ｔｉｅｒ")
+        assert result == "t:creature tier"
+
+    def test_convert_filters_mana_cost_m_field(self, ja_builder):
         """Test operator conversion for マナコスト to use 'm' field."""
         result = build_text(ja_builder, "マナコスト3以上")
         assert "m>=3" in result
 
+    def test_english_pipeline_skips_japanese_passes(
+        self, query_builder, ja_builder, mocker
+    ):
+        """Test the English pipeline never runs Japanese-only conversions."""
+        filters = mocker.spy(query_builder, "_convert_filters")
+        apply = mocker.spy(AbilityPatternMatcher, "apply")
+
+        result = build_text(query_builder, "white creatures with power 3 or more")
+
+        assert "t:creature" in result
+        filters.assert_not_called()
+        apply.assert_not_called()
+
+        # The same spy observes the Japanese pipeline
+        build_text(ja_builder, "戦場に出たときにカードを引く白いクリーチャー")
+        apply.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            (
+                "パワー3以上の赤いクリーチャーでマナ総量5以下",
+                "p>=3のc:r t:creatureでmv<=5",
+            ),
+            (
+                "白のクリーチャータフネス2未満 青い土地",
+                "c:w t:creaturetou<2 c:u t:land",
+            ),
+            (
+                "点数で見たマナコスト4黒いソーサリーマナコスト1",
+                "cmc=4c:b t:sorcerym=1",
+            ),
+        ],
+    )
+    def test_convert_filters_comparisons_and_colors_together(
+        self, ja_builder, text, expected
+    ):
+        """Test comparisons and color/type pairs convert in one scan."""
+        assert ja_builder._convert_filters(text) == expected
+
+    def test_japanese_passes_leave_ascii_text_unchanged(self, ja_builder):
+        """Test Japanese-only passes return pure ASCII input as is."""
+        text = "c:r t:creature p>=3"
+        assert ja_builder._convert_filters(text) == text
+
+    def test_japanese_pipeline_ascii_input_only_cleaned(self, ja_builder, mocker):
+        """Test pasted Scryfall syntax skips every Japanese conversion pass."""
+        assert ja_builder._terms.ascii_inert
+        convert = mocker.patch.object(ja_builder, "_convert_filters")
+        assert ja_builder._pipeline("c:r  t:creature p >= 3") == "c:r t:creature p>=3"
+        convert.assert_not_called()
+
+    def test_convert_filters_mixed_comparisons_single_pass(self, ja_builder):
+        """Test power, toughness and mana comparisons convert together."""
+        result = ja_builder._convert_filters(
+            "パワー2以上タフネス3未満点数で見たマナコスト4マナコスト1以下"
+        )
+        assert result == "p>=2tou<3cmc=4m<=1"
+
     def test_generate_suggestions_competitive_japanese(self, ja_builder):
         """Test competitive query suggestions in Japanese mode."""
         from scryfall_mcp.models import ParsedQuery
@@ -723,6 +1003,21 @@ class TestQueryBuilder:
         result = ja_builder.build(parsed)
         assert any("f:standard" in s or "f:modern" in s for s in result.suggestions)
 
+    def test_generate_suggestions_competitive_case_and_glued_text(self, ja_builder):
+        """Test competitive words match case-insensitively inside other text."""
+        from scryfall_mcp.models import ParsedQuery
+
+        for text in ("TOURNAMENT向けのカード", "Metaクリーチャー"):
+            parsed = ParsedQuery(
+                original_text=text,
+                normalized_text=text,
+                intent="search_cards",
+                language="ja",
+                entities={"colors": [], "types": [], "keywords": []},
+            )
+            result = ja_builder.build(parsed)
+            assert any("f:standard" in s for s in result.suggestions), text
+
     def test_ultra_complex_query_multiple_abilities(self, ja_builder):
         """Test ultra-complex query with 3+ abilities combined."""
         query = "飛行と速攻と死亡時にカードを引く赤いクリーチャーでパワー3以上"
@@ -0,0 +1,65 @@
+"""Tests for search parser module."""
+
+from __future__ import annotations
+
+import pytest
+
+from scryfall_mcp.i18n import english_mapping, japanese_mapping
+from scryfall_mcp.search.parser import SearchParser
+
+
+class TestSearchParser:
+    """Test SearchParser class."""
+
+    @pytest.fixture
+    def en_parser(self):
+        """Create an English parser."""
+        return SearchParser(english_mapping)
+
+    @pytest.fixture
+    def ja_parser(self):
+        """Create a Japanese parser."""
+        return SearchParser(japanese_mapping)
+
+    def test_fullwidth_normalization_nfkc(self, ja_parser, en_parser):
+        """Test full-width digits/operators fold to ASCII via NFKC."""
+        assert ja_parser._normalize_text("（０１２３４５６７８９）［！＝］") == (
+            "(0123456789)[!=]"
+        )
+
+        # Only the Japanese locale normalizes full-width characters
+        assert en_parser._normalize_text("３") == "３"
+
+    def test_smart_quotes_normalized(self, en_parser):
+        """Test curly quotes become ASCII quotes in one translate pass."""
+        text = "\u201cLightning Bolt\u201d \u2018s\u2019"
+        assert en_parser._normalize_text(text) == "\"Lightning Bolt\" 's'"
+
+    def test_detect_intent_bucket_priority(self, en_parser, ja_parser):
+        """Test a higher-priority intent wins wherever it appears in text."""
+        assert en_parser.parse("how much does it cost to find").intent == (
+            "card_search"
+        )
+        assert en_parser.parse("Price of a deck with dragons").intent == (
+            "price_inquiry"
+        )
+        assert ja_parser.parse("デッキに採用する値段").intent == "price_inquiry"
+        assert ja_parser.parse("稲妻").intent == "general_search"
+
+    def test_english_entities_match_inflected_words(self, en_parser):
+        """Test English colors/types match inside plurals and compounds."""
+        entities = en_parser.parse("Red creatures and BLUE lands").entities
+        assert entities["colors"] == ["blue", "red"]
+        assert entities["types"] == ["creature", "land"]
+
+    def test_japanese_entities_vocabulary_order(self, ja_parser):
+        """Test Japanese colors/types follow vocabulary order, ASCII matches none."""
+        entities = ja_parser.parse('土地か無色の白いクリーチャー "Sol Ring"').entities
+        assert entities["colors"] == ["white", "colorless"]
+        assert entities["types"] == ["creature", "land"]
+        assert entities["card_names"] == ["Sol Ring"]
+
+        entities = ja_parser.parse('c:w t:creature "Sol Ring"').entities
+        assert entities["colors"] == []
+        assert entities["types"] == []
+        assert entities["card_names"] == ["Sol Ring"]
@@ -8,6 +8,7 @@ from scryfall_mcp.i18n import english_mapping, japanese_mapping
 from scryfall_mcp.models import (
     BuiltQuery,
     Card,
+    Prices,
     SearchOptions,
     SearchResult,
 )
@@ -370,11 +371,11 @@ class TestSearchPresenter:
 
     def test_format_prices(self, en_presenter):
         """Test price formatting."""
-        prices = {
-            "usd": "10.50",
-            "eur": "9.25",
-            "tix": "2.5",
-        }
+        prices = Prices(
+            usd="10.50",
+            eur="9.25",
+            tix="2.5",
+        )
         price_text = en_presenter._format_prices(prices)
 
         assert "$10.50" in price_text
@@ -384,11 +385,11 @@ class TestSearchPresenter:
 
     def test_format_prices_ja(self, ja_presenter):
         """Test price formatting in Japanese."""
-        prices = {
-            "usd": "10.50",
-            "eur": None,
-            "tix": None,
-        }
+        prices = Prices(
+            usd="10.50",
+            eur=None,
+            tix=None,
+        )
         price_text = ja_presenter._format_prices(prices)
 
         assert "$10.50" in price_text
@@ -396,15 +397,34 @@ class TestSearchPresenter:
 
     def test_format_prices_empty(self, en_presenter):
         """Test price formatting with no prices."""
-        prices = {
-            "usd": None,
-            "eur": None,
-            "tix": None,
-        }
+        prices = Prices(
+            usd=None,
+            eur=None,
+            tix=None,
+        )
         price_text = en_presenter._format_prices(prices)
 
         assert price_text == ""
 
+    def test_non_null_prices_covers_all_price_fields(self, en_presenter):
+        """Test the unrolled price filter keeps every set Prices field."""
+        prices = Prices(**dict.fromkeys(Prices.model_fields, "1.00"))
+        assert list(en_presenter._non_null_prices(prices)) == list(Prices.model_fields)
+        assert en_presenter._non_null_prices(Prices(eur="2.00")) == {"eur": "2.00"}
+
+    def test_prices_read_without_model_dump(
+        self, en_presenter, sample_search_result, basic_built_query, mocker
+    ):
+        """Test card text and resource read prices without dumping the model."""
+        model_dump = mocker.spy(Prices, "model_dump")
+        items = en_presenter.present_results(
+            sample_search_result, basic_built_query, SearchOptions(max_results=10)
+        )
+
+        assert model_dump.call_count == 0
+        assert "$1.50" in items[1].text
+        assert '"usd_foil":"3.00"' in items[2].text
+
     def test_create_card_resource(self, en_presenter, sample_card):
         """Test creating embedded card resource."""
         options = SearchOptions(max_results=10)
@@ -415,6 +435,19 @@ class TestSearchPresenter:
         assert resource.mime_type == "application/json"
         assert "Lightning Bolt" in resource.text
 
+    def test_create_card_resource_json_format(self, ja_presenter, sample_card_data):
+        """Test the resource JSON is compact and keeps raw non-ASCII."""
+        data = sample_card_data.copy()
+        data["flavor_text"] = "稲妻が走る"
+        card = Card(**data)
+
+        options = SearchOptions(max_results=10)
+        resource = ja_presenter._create_card_resource(card, 1, options)
+
+        assert resource.text.startswith('{"id":"')
+        assert "\n" not in resource.text
+        assert '"flavor_text":"稲妻が走る"' in resource.text
+
     def test_create_card_resource_with_faces(self, en_presenter, double_faced_card):
         """Test creating embedded resource for double-faced card."""
         options = SearchOptions(max_results=10)
@@ -533,8 +566,15 @@ class TestSearchPresenter:
 
     def test_rarity_translations_ja(self, ja_presenter, sample_card_data):
         """Test all rarity translations in Japanese."""
-        rarities = ["common", "uncommon", "rare", "mythic"]
-        expected = ["コモン", "アンコモン", "レア", "神話レア"]
+        rarities = ["common", "uncommon", "rare", "mythic", "special", "bonus"]
+        expected = [
+            "コモン",
+            "アンコモン",
+            "レア",
+            "神話レア",
+            "スペシャル",
+            "ボーナス",
+        ]
 
         for rarity, expected_text in zip(rarities, expected, strict=False):
             data = sample_card_data.copy()
@@ -590,6 +630,16 @@ class TestSearchPresenter:
 
         assert "Scryfallで詳細を見る" in card_text.text
 
+    def test_card_template_shared_per_language(self, ja_presenter, en_presenter):
+        """Test card templates are built once per language and reused."""
+        assert SearchPresenter(japanese_mapping)._card_template is (
+            ja_presenter._card_template
+        )
+        assert en_presenter._card_template is not ja_presenter._card_template
+        assert ja_presenter._card_template.scryfall_link_prefix == (
+            "\n\n[Scryfallで詳細を見る]("
+        )
+
     def test_japanese_multilingual_card_display(self, ja_presenter, sample_card_data):
         """Test that Japanese cards display printed_name, printed_type_line, and printed_text."""
         # Create a Japanese card with multilingual fields
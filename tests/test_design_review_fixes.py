@@ -329,6 +329,25 @@ class TestToolPipelinePlaceholderResolution:
         finally:
             set_current_locale("en")
 
+    @pytest.mark.asyncio
+    async def test_pipeline_skips_resolver_without_placeholder(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from unittest.mock import patch
+
+        from scryfall_mcp.tools.search import CardSearchTool
+
+        monkeypatch.setenv("SCRYFALL_MCP_USER_AGENT", "Test/1.0 (test@example.com)")
+        request = SearchCardsRequest(query="Lightning Bolt", language="en")
+
+        with patch(
+            "scryfall_mcp.tools.search.resolve_latest_set_placeholder"
+        ) as mock_resolve:
+            _, _, built = await CardSearchTool._build_query_pipeline(request)
+
+        mock_resolve.assert_not_called()
+        assert built.scryfall_query == "Lightning Bolt"
+
 
 class TestConfigFileAtomicWrite:
     """PII config writes must be atomic with 0o600 from creation."""